@@ -1,10 +1,18 @@
+import atexit
 import json
+import logging
 import os
-import shutil
+import re
 import tempfile
+from threading import Lock
 from time import mktime, time
 
-from streamlink.compat import is_win32
+from streamlink.compat import is_win32, os_replace
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 if is_win32:
     xdg_cache = os.environ.get("APPDATA", os.path.expanduser("~"))
@@ -13,61 +21,185 @@ else:
 
 cache_dir = os.path.join(xdg_cache, "streamlink")
 
+log = logging.getLogger(__name__)
+
+# Cache instances with unsaved changes, which get flushed when the interpreter exits,
+# and which are kept alive until then, so that short-lived instances don't lose their changes
+_dirty_caches = set()
+
+
+def _flush_all():
+    for cache in list(_dirty_caches):
+        # don't let a single cache prevent the others from being written
+        try:
+            cache.flush()
+        except Exception as err:
+            log.error("Failed to write cache file {0}: {1}".format(cache.filename, err))
+
+
+atexit.register(_flush_all)
+
+
+# orjson deserializes integers exceeding 64 bits as floats, so leave data with long digit sequences to the json module
+_re_big_int = re.compile(br"\d{19}")
+
+
+def _dumps_json(obj):
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads_json(data):
+    return json.loads(data.decode("utf-8"))
+
+
+if orjson is not None:
+    def _dumps(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # values which are supported by the json module, eg. integers exceeding 64 bits
+            return _dumps_json(obj)
+
+    def _loads(data):
+        if _re_big_int.search(data):
+            return _loads_json(data)
+
+        return orjson.loads(data)
+else:  # pragma: no cover
+    _dumps = _dumps_json
+    _loads = _loads_json
+
 
 class Cache(object):
-    """Caches Python values as JSON and prunes expired entries."""
+    """
+    Caches Python values as JSON and prunes expired entries.
+
+    Changes are kept in memory and get written to disk when calling :meth:`flush`,
+    which is done automatically when the interpreter exits.
+    """
 
     def __init__(self, filename, key_prefix=""):
         self.key_prefix = key_prefix
         self.filename = os.path.join(cache_dir, filename)
+        self._dir = os.path.dirname(self.filename)
 
         self._cache = {}
+        self._stat = None
+        self._loaded = False
+        self._dirty = False
+        # entries which were set since the last flush and which need to be applied on top of the file's content
+        self._changes = {}
+        self._lock = Lock()
+
+        # also ignore the error if the directory already exists
+        try:
+            os.makedirs(self._dir)
+        except (IOError, OSError):
+            pass
+
+    @property
+    def key_prefix(self):
+        return self._key_prefix
+
+    @key_prefix.setter
+    def key_prefix(self, key_prefix):
+        self._key_prefix = key_prefix
+        self._prefix = "{0}:".format(key_prefix) if key_prefix else ""
+
+    def _get_stat(self):
+        try:
+            st = os.stat(self.filename)
+        except (IOError, OSError):
+            return None
+
+        # the cache file gets replaced on each save, so its inode number changes even if its mtime and size don't
+        return st.st_ino, getattr(st, "st_mtime_ns", st.st_mtime), st.st_size
 
     def _load(self):
-        if os.path.exists(self.filename):
+        stat = self._get_stat()
+
+        # skip reading and parsing the file if it hasn't changed since the last load or save
+        if self._loaded and stat == self._stat:
+            return
+
+        self._cache = {}
+        self._stat = None
+        self._loaded = True
+
+        if stat is not None:
             try:
-                with open(self.filename, "r") as fd:
-                    self._cache = json.load(fd)
+                with open(self.filename, "rb") as fd:
+                    self._cache = _loads(fd.read())
             except Exception:
                 self._cache = {}
-        else:
-            self._cache = {}
+            else:
+                self._stat = stat
+
+        # don't discard unsaved changes when the file was modified by someone else
+        self._cache.update(self._changes)
 
     def _prune(self):
         now = time()
-        pruned = []
-
-        for key, value in self._cache.items():
-            expires = value.get("expires", now)
-            if expires <= now:
-                pruned.append(key)
+        cache = {key: value for key, value in self._cache.items() if value.get("expires", now) > now}
+        pruned = len(cache) != len(self._cache)
+        self._cache = cache
 
-        for key in pruned:
-            self._cache.pop(key, None)
-
-        return len(pruned) > 0
+        return pruned
 
     def _save(self):
-        fd, tempname = tempfile.mkstemp()
-        fd = os.fdopen(fd, "w")
-        json.dump(self._cache, fd, indent=2, separators=(",", ": "))
-        fd.close()
-
         # Silently ignore errors
         try:
-            if not os.path.exists(os.path.dirname(self.filename)):
-                os.makedirs(os.path.dirname(self.filename))
-
-            shutil.move(tempname, self.filename)
+            # create the temp file next to the cache file, so that it can be renamed atomically
+            fd, tempname = tempfile.mkstemp(dir=self._dir)
         except (IOError, OSError):
+            self._stat = None
+            return False
+
+        try:
+            try:
+                os.write(fd, _dumps(self._cache))
+            finally:
+                os.close(fd)
+            os_replace(tempname, self.filename)
+        except (IOError, OSError, TypeError, ValueError):
+            # values which can't be serialized don't leave a temp file behind either
             os.remove(tempname)
+            self._stat = None
+            return False
+
+        self._stat = self._get_stat()
+        return True
+
+    def _set_dirty(self):
+        self._dirty = True
+        _dirty_caches.add(self)
+
+    def flush(self):
+        """Write all pending changes to disk."""
+
+        with self._lock:
+            if not self._dirty:
+                return
+
+            self._load()
+            self._prune()
+            # keep the pending changes if writing failed, so that they can be written by the next flush
+            if self._save():
+                self._changes.clear()
+                self._dirty = False
+                _dirty_caches.discard(self)
 
     def set(self, key, value, expires=60 * 60 * 24 * 7, expires_at=None):
-        self._load()
+        with self._lock:
+            self._set(key, value, expires, expires_at)
+
+    def _set(self, key, value, expires, expires_at):
+        if not self._loaded:
+            self._load()
         self._prune()
 
-        if self.key_prefix:
-            key = "{0}:{1}".format(self.key_prefix, key)
+        if self._prefix:
+            key = self._prefix + key
 
         if expires_at is None:
             expires += time()
@@ -77,17 +209,23 @@ class Cache(object):
             except OverflowError:
                 expires = 0
 
-        self._cache[key] = dict(value=value, expires=expires)
-        self._save()
+        self._cache[key] = self._changes[key] = dict(value=value, expires=expires)
+        self._set_dirty()
 
     def get(self, key, default=None):
-        self._load()
+        with self._lock:
+            return self._get(key, default)
+
+    def _get(self, key, default):
+        # unsaved changes make the in-memory cache authoritative until it gets flushed
+        if not self._dirty:
+            self._load()
 
         if self._prune():
-            self._save()
+            self._set_dirty()
 
-        if self.key_prefix:
-            key = "{0}:{1}".format(self.key_prefix, key)
+        if self._prefix:
+            key = self._prefix + key
 
         if key in self._cache and "value" in self._cache[key]:
             return self._cache[key]["value"]
@@ -95,22 +233,21 @@ class Cache(object):
             return default
 
     def get_all(self):
-        ret = {}
-        self._load()
+        with self._lock:
+            return self._get_all()
+
+    def _get_all(self):
+        if not self._dirty:
+            self._load()
 
         if self._prune():
-            self._save()
+            self._set_dirty()
 
-        for key, value in self._cache.items():
-            if self.key_prefix:
-                prefix = self.key_prefix + ":"
-            else:
-                prefix = ""
-            if key.startswith(prefix):
-                okey = key[len(prefix):]
-                ret[okey] = value["value"]
+        # a single pass over all entries, which only keeps the ones with the key prefix
+        prefix = self._prefix
+        length = len(prefix)
 
-        return ret
+        return {key[length:]: value["value"] for key, value in self._cache.items() if key.startswith(prefix)}
 
 
 __all__ = ["Cache"]
@@ -80,6 +80,19 @@ except ImportError:
     from HTMLParser import HTMLParser
     html_unescape = unescape = HTMLParser().unescape
 
+try:
+    from os import replace as os_replace
+except ImportError:
+    if is_win32:
+        def os_replace(src, dst):
+            try:
+                os.remove(dst)
+            except OSError:
+                pass
+            os.rename(src, dst)
+    else:
+        os_replace = os.rename
+
 try:
     from functools import lru_cache
 except ImportError:
@@ -93,5 +106,5 @@ __all__ = [
     "ABC", "Callable", "Mapping", "Match", "RE_PATTERN_TYPE", "indent", "is_py2", "is_py3", "is_py33", "is_win32", "str",
     "bytes", "urlparse", "urlunparse", "urljoin", "parse_qs", "parse_qsl", "quote", "quote_plus",
     "unquote", "unquote_plus", "queue", "range", "singledispatch", "urlencode", "devnull", "which",
-    "izip", "urlsplit", "urlunsplit", "getargspec", "html_unescape", "lru_cache", "_inspect"
+    "izip", "urlsplit", "urlunsplit", "getargspec", "html_unescape", "lru_cache", "os_replace", "_inspect"
 ]
@@ -3,6 +3,20 @@ from typing import Optional, Sequence, Union
 from streamlink.compat import indent
 
 
+class LazyRepr(object):
+    """
+    Error message argument which gets turned into the repr() of the wrapped object when the message gets formatted.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self):
+        return repr(self.obj)
+
+
 class ValidationError(ValueError):
     MAX_LENGTH = 60
 
@@ -13,9 +27,20 @@ class ValidationError(ValueError):
         self.context = kwargs.pop("context", None)
         # type: Optional[Union[Exception]]
         if len(error) == 1 and type(error[0]) is str:
-            self.errors = (self._truncate(error[0], **kwargs), )
+            # errors of failed sub-schemas often get discarded, e.g. by AnySchema,
+            # so don't format the error message until it is actually needed
+            self._errors = None
+            self._template = error[0]
+            self._kwargs = kwargs
         else:
-            self.errors = error
+            self._errors = error
+
+    @property
+    def errors(self):
+        if self._errors is None:
+            self._errors = (self._truncate(self._template, **self._kwargs), )
+            self._template = self._kwargs = None
+        return self._errors
 
     def _ellipsis(self, string):
         # type: (str)
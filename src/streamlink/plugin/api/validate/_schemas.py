@@ -1,16 +1,25 @@
 from typing import Any, Callable, FrozenSet, List, Optional, Pattern, Set, Tuple, Type, Union
 
+from streamlink.compat import str as text_type
+
+
+_literal_types = frozenset((bytes, int, str, text_type))
+
 
 class SchemaContainer(object):
     """
     A simple schema container.
     """
 
+    __slots__ = ("schema",)
+
     def __init__(self, schema):
         self.schema = schema
 
 
 class _CollectionSchemaContainer(SchemaContainer):
+    __slots__ = ()
+
     def __init__(self, *schemas):
         super(_CollectionSchemaContainer, self).__init__(schemas)
 
@@ -21,6 +30,8 @@ class AllSchema(_CollectionSchemaContainer):
     The last validation result gets returned.
     """
 
+    __slots__ = ()
+
 
 class AnySchema(_CollectionSchemaContainer):
     """
@@ -28,6 +39,16 @@ class AnySchema(_CollectionSchemaContainer):
     The first successful validation result gets returned.
     """
 
+    __slots__ = ("_literals",)
+
+    def __init__(self, *schemas):
+        super(AnySchema, self).__init__(*schemas)
+        # literal subschemas can be checked via a single set lookup
+        if schemas and all(type(schema) in _literal_types for schema in schemas):
+            self._literals = frozenset(schemas)
+        else:
+            self._literals = None
+
 
 class NoneOrAllSchema(_CollectionSchemaContainer):
     """
@@ -35,6 +56,8 @@ class NoneOrAllSchema(_CollectionSchemaContainer):
     The last validation result gets returned.
     """
 
+    __slots__ = ()
+
 
 class ListSchema(_CollectionSchemaContainer):
     """
@@ -42,6 +65,8 @@ class ListSchema(_CollectionSchemaContainer):
     A new list of the validated input gets returned.
     """
 
+    __slots__ = ()
+
 
 class GetItemSchema(object):
     """
@@ -52,6 +77,8 @@ class GetItemSchema(object):
     Supported inputs are XML elements, regex matches and anything that implements __getitem__.
     """
 
+    __slots__ = ("item", "default", "strict", "_items")
+
     def __init__(
         self,
         item,
@@ -62,6 +89,8 @@ class GetItemSchema(object):
         self.item = item
         self.default = default
         self.strict = strict
+        # the sequence of keys of the (recursive) lookup
+        self._items = item if type(item) is tuple and not strict else (item,)
 
 
 class RegexSchema(object):
@@ -69,6 +98,8 @@ class RegexSchema(object):
     A regex pattern that must match using the provided method.
     """
 
+    __slots__ = ("pattern", "method")
+
     def __init__(
         self,
         pattern,
@@ -85,6 +116,8 @@ class TransformSchema(object):
     Transform the input using the specified function and args/keywords.
     """
 
+    __slots__ = ("func", "args", "kwargs")
+
     def __init__(
         self,
         func,
@@ -102,6 +135,8 @@ class OptionalSchema(object):
     An optional key set in a dict or dict in a :class:`UnionSchema`.
     """
 
+    __slots__ = ("key",)
+
     def __init__(self, key):
         # type: (Any)
         self.key = key
@@ -112,12 +147,16 @@ class AttrSchema(SchemaContainer):
     Validate attributes of an input object.
     """
 
+    __slots__ = ()
+
 
 class XmlElementSchema(object):
     """
     Validate an XML element.
     """
 
+    __slots__ = ("tag", "text", "attrib", "tail")
+
     # signature is weird because of backwards compatiblity
     def __init__(
         self,
@@ -138,6 +177,8 @@ class UnionGetSchema(object):
     Validate multiple :class:`GetItemSchema` schemas on the same input.
     """
 
+    __slots__ = ("getters", "seq")
+
     def __init__(self, *getters, **kw):
         self.getters = tuple(GetItemSchema(getter) for getter in getters)
         self.seq = kw.get("seq", tuple)
@@ -150,3 +191,5 @@ class UnionSchema(SchemaContainer):
 
     Can be a tuple, list, set, frozenset or dict of schemas.
     """
+
+    __slots__ = ()
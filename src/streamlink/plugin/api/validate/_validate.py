@@ -1,11 +1,13 @@
 from collections import OrderedDict
-from copy import copy, deepcopy
+from copy import copy
+from operator import getitem
+from types import BuiltinFunctionType, FunctionType, MethodType
 
 from lxml.etree import Element, iselement
 
-from streamlink.compat import Callable, Match, RE_PATTERN_TYPE, is_py2, singledispatch, str as text_type
+from streamlink.compat import Callable, Match, RE_PATTERN_TYPE, is_py2, lru_cache, singledispatch, str as text_type
 from streamlink.exceptions import PluginError
-from streamlink.plugin.api.validate._exception import ValidationError
+from streamlink.plugin.api.validate._exception import LazyRepr, ValidationError
 from streamlink.plugin.api.validate._schemas import (
     AllSchema,
     AnySchema,
@@ -15,6 +17,7 @@ from streamlink.plugin.api.validate._schemas import (
     NoneOrAllSchema,
     OptionalSchema,
     RegexSchema,
+    SchemaContainer,
     TransformSchema,
     UnionGetSchema,
     UnionSchema,
@@ -25,11 +28,33 @@ from streamlink.plugin.api.validate._schemas import (
 class Schema(AllSchema):
     """
     Wrapper class for :class:`AllSchema` with a validate method which raises :class:`PluginError` by default on error.
+
+    The schema gets compiled into a single validation function when it's initialized.
     """
 
+    __slots__ = ("_validate",)
+
+    def __init__(self, *schemas):
+        super(Schema, self).__init__(*schemas)
+        self._validate = self.compile()
+
+    def compile(self):
+        """
+        Compile the schema into a validation function which doesn't need to resolve the schema types on each call.
+
+        Compiled functions of hashable schemas are cached, so that identical schemas only get compiled once.
+        """
+
+        try:
+            key = _SchemaKey(self)
+        except TypeError:
+            return _compile(self)
+
+        return _compile_cached(key)
+
     def validate(self, value, name="result", exception=PluginError):
         try:
-            return validate(self, value)
+            return self._validate(value)
         except ValidationError as err:
             raise exception("Unable to validate {0}: {1}".format(name, err))
 
@@ -37,20 +62,30 @@ class Schema(AllSchema):
 # ----
 
 
-@singledispatch
 def validate(schema, value):
+    # look up the validation functions of the most common schema types directly by their exact type
+    # and only fall back to the singledispatch lookup (MRO resolution) if the schema type is unknown
+    func = _validate_fast.get(type(schema))
+    if func is not None:
+        return func(schema, value)
+
+    return _validate(schema, value)
+
+
+@singledispatch
+def _validate(schema, value):
     if schema != value:
         raise ValidationError(
             "{value} does not equal {expected}",
-            value=repr(value),
-            expected=repr(schema),
+            value=LazyRepr(value),
+            expected=LazyRepr(schema),
             schema="equality",
         )
 
     return value
 
 
-@validate.register(type)
+@_validate.register(type)
 def _validate_type(schema, value):
     if not is_py2:
         long = int
@@ -63,7 +98,7 @@ def _validate_type(schema, value):
     if not isinstance(value, schema):
         raise ValidationError(
             "Type of {value} should be {expected}, but is {actual}",
-            value=repr(value),
+            value=LazyRepr(value),
             expected=schema.__name__,
             actual=type(value).__name__,
             schema=type,
@@ -72,49 +107,63 @@ def _validate_type(schema, value):
     return value
 
 
-@validate.register(list)
-@validate.register(tuple)
-@validate.register(set)
-@validate.register(frozenset)
+@_validate.register(list)
+@_validate.register(tuple)
+@_validate.register(set)
+@_validate.register(frozenset)
 def _validate_sequence(schema, value):
     cls = type(schema)
     validate(cls, value)
 
-    return cls(
-        validate(AnySchema(*schema), v) for v in value
-    )
+    if len(schema) == 1:
+        subschema = next(iter(schema))
+        try:
+            return cls([validate(subschema, v) for v in value])
+        except ValidationError as err:
+            # same error as the one raised by an AnySchema with a single subschema
+            raise ValidationError(err, schema=AnySchema)
+
+    subschema = AnySchema(*schema)
+
+    return cls([validate(subschema, v) for v in value])
 
 
-@validate.register(dict)
+_dict_key_literal_types = frozenset((str, text_type))
+_dict_key_schema_types = frozenset((type, AllSchema, AnySchema, TransformSchema, UnionSchema))
+
+
+@_validate.register(dict)
 def _validate_dict(schema, value):
     cls = type(schema)
     validate(cls, value)
     new = cls()
 
     for key, subschema in schema.items():
-        if isinstance(key, OptionalSchema):
-            if key.key not in value:
-                continue
-            key = key.key
-
-        if type(key) in (type, AllSchema, AnySchema, TransformSchema, UnionSchema):
-            for subkey, subvalue in value.items():
-                try:
-                    newkey = validate(key, subkey)
-                except ValidationError as err:
-                    raise ValidationError("Unable to validate key", schema=dict, context=err)
-                try:
-                    newvalue = validate(subschema, subvalue)
-                except ValidationError as err:
-                    raise ValidationError("Unable to validate value", schema=dict, context=err)
-                new[newkey] = newvalue
-            break
+        # literal string keys are the most common ones and don't require any special treatment
+        if type(key) not in _dict_key_literal_types:
+            if isinstance(key, OptionalSchema):
+                if key.key not in value:
+                    continue
+                key = key.key
+
+            if type(key) in _dict_key_schema_types:
+                for subkey, subvalue in value.items():
+                    try:
+                        newkey = validate(key, subkey)
+                    except ValidationError as err:
+                        raise ValidationError("Unable to validate key", schema=dict, context=err)
+                    try:
+                        newvalue = validate(subschema, subvalue)
+                    except ValidationError as err:
+                        raise ValidationError("Unable to validate value", schema=dict, context=err)
+                    new[newkey] = newvalue
+                break
 
         if key not in value:
             raise ValidationError(
                 "Key {key} not found in {value}",
-                key=repr(key),
-                value=repr(value),
+                key=LazyRepr(key),
+                value=LazyRepr(value),
                 schema=dict,
             )
 
@@ -123,7 +172,7 @@ def _validate_dict(schema, value):
         except ValidationError as err:
             raise ValidationError(
                 "Unable to validate value of key {key}",
-                key=repr(key),
+                key=LazyRepr(key),
                 schema=dict,
                 context=err,
             )
@@ -131,7 +180,7 @@ def _validate_dict(schema, value):
     return new
 
 
-@validate.register(Callable)
+@_validate.register(Callable)
 def _validate_callable(schema, value):
     # type: (Callable)
     if not schema(value):
@@ -144,13 +193,13 @@ def _validate_callable(schema, value):
     return value
 
 
-@validate.register(RE_PATTERN_TYPE)
+@_validate.register(RE_PATTERN_TYPE)
 def _validate_pattern(schema, value):
     # type: (RE_PATTERN_TYPE)
     if not isinstance(value, (text_type, bytes)):
         raise ValidationError(
             "Type of {value} should be str or bytes, but is {actual}",
-            value=repr(value),
+            value=LazyRepr(value),
             actual=type(value).__name__,
             schema=RE_PATTERN_TYPE,
         )
@@ -163,7 +212,7 @@ def _validate_pattern(schema, value):
     return result
 
 
-@validate.register(AllSchema)
+@_validate.register(AllSchema)
 def _validate_allschema(schema, value):
     # type: (AllSchema)
     for schema in schema.schema:
@@ -172,9 +221,16 @@ def _validate_allschema(schema, value):
     return value
 
 
-@validate.register(AnySchema)
+@_validate.register(AnySchema)
 def _validate_anyschema(schema, value):
     # type: (AnySchema)
+    if schema._literals is not None:
+        try:
+            if value in schema._literals:
+                return value
+        except TypeError:
+            pass
+
     errors = []
     for subschema in schema.schema:
         try:
@@ -185,7 +241,7 @@ def _validate_anyschema(schema, value):
     raise ValidationError(*errors, schema=AnySchema)
 
 
-@validate.register(NoneOrAllSchema)
+@_validate.register(NoneOrAllSchema)
 def _validate_noneorallschema(schema, value):
     # type: (NoneOrAllSchema)
     if value is not None:
@@ -198,13 +254,13 @@ def _validate_noneorallschema(schema, value):
     return value
 
 
-@validate.register(ListSchema)
+@_validate.register(ListSchema)
 def _validate_listschema(schema, value):
     # type: (ListSchema)
     if type(value) is not list:
         raise ValidationError(
             "Type of {value} should be list, but is {actual}",
-            value=repr(value),
+            value=LazyRepr(value),
             actual=type(value).__name__,
             schema=ListSchema,
         )
@@ -230,13 +286,13 @@ def _validate_listschema(schema, value):
     return new
 
 
-@validate.register(RegexSchema)
+@_validate.register(RegexSchema)
 def _validate_regexschema(schema, value):
     # type: (RegexSchema)
     if not isinstance(value, (text_type, bytes)):
         raise ValidationError(
             "Type of {value} should be str or bytes, but is {actual}",
-            value=repr(value),
+            value=LazyRepr(value),
             actual=type(value).__name__,
             schema=RegexSchema,
         )
@@ -249,35 +305,51 @@ def _validate_regexschema(schema, value):
     if result is None:
         raise ValidationError(
             "RE_PATTERN_TYPE {pattern} did not match {value}",
-            pattern=repr(schema.pattern.pattern),
-            value=repr(value),
+            pattern=LazyRepr(schema.pattern.pattern),
+            value=LazyRepr(value),
             schema=RegexSchema,
         )
 
     return result
 
 
-@validate.register(TransformSchema)
+@_validate.register(TransformSchema)
 def _validate_transformschema(schema, value):
     # type: (TransformSchema)
     validate(Callable, schema.func)
     return schema.func(value, *schema.args, **schema.kwargs)
 
 
-@validate.register(GetItemSchema)
+def _getitem_xml_element(value, key):
+    return value.attrib[key]
+
+
+# item getter functions of input types, so that the type checks only need to be done once per type
+_item_getters = {}
+
+
+def _get_item_getter(value):
+    if iselement(value):
+        getter = _getitem_xml_element
+    elif isinstance(value, Match):
+        getter = Match.group
+    else:
+        getter = getitem
+    _item_getters[type(value)] = getter
+
+    return getter
+
+
+@_validate.register(GetItemSchema)
 def _validate_getitemschema(schema, value):
     # type: (GetItemSchema)
-    item = schema.item if type(schema.item) is tuple and not schema.strict else (schema.item,)
+    item = schema._items
     idx = 0
     key = None
     try:
         for key in item:
-            if iselement(value):
-                value = value.attrib[key]
-            elif isinstance(value, Match):
-                value = value.group(key)
-            else:
-                value = value[key]
+            getter = _item_getters.get(type(value)) or _get_item_getter(value)
+            value = getter(value, key)
             idx += 1
         return value
     except (KeyError, IndexError):
@@ -285,22 +357,22 @@ def _validate_getitemschema(schema, value):
         if idx < len(item) - 1:
             raise ValidationError(
                 "Item {key} was not found in object {value}",
-                key=repr(key),
-                value=repr(value),
+                key=LazyRepr(key),
+                value=LazyRepr(value),
                 schema=GetItemSchema,
             )
         return schema.default
     except (TypeError, AttributeError) as err:
         raise ValidationError(
             "Could not get key {key} from object {value}",
-            key=repr(key),
-            value=repr(value),
+            key=LazyRepr(key),
+            value=LazyRepr(value),
             schema=GetItemSchema,
             context=err,
         )
 
 
-@validate.register(AttrSchema)
+@_validate.register(AttrSchema)
 def _validate_attrschema(schema, value):
     # type: (AttrSchema)
     new = copy(value)
@@ -309,8 +381,8 @@ def _validate_attrschema(schema, value):
         if not hasattr(value, key):
             raise ValidationError(
                 "Attribute {key} not found on object {value}",
-                key=repr(key),
-                value=repr(value),
+                key=LazyRepr(key),
+                value=LazyRepr(value),
                 schema=AttrSchema,
             )
 
@@ -319,7 +391,7 @@ def _validate_attrschema(schema, value):
         except ValidationError as err:
             raise ValidationError(
                 "Could not validate attribute {key}",
-                key=repr(key),
+                key=LazyRepr(key),
                 schema=AttrSchema,
                 context=err,
             )
@@ -329,10 +401,15 @@ def _validate_attrschema(schema, value):
     return new
 
 
-@validate.register(XmlElementSchema)
+@_validate.register(XmlElementSchema)
 def _validate_xmlelementschema(schema, value):
     # type: (XmlElementSchema)
     validate(iselement, value)
+
+    # nothing to validate: copy the whole element tree at once instead of rebuilding it
+    if schema.tag is None and schema.attrib is None and schema.text is None and schema.tail is None:
+        return copy(value)
+
     tag = value.tag
     attrib = value.attrib
     text = value.text
@@ -365,13 +442,13 @@ def _validate_xmlelementschema(schema, value):
     new = Element(tag, attrib)
     new.text = text
     new.tail = tail
-    for child in value:
-        new.append(deepcopy(child))
+    # copying lxml elements always copies their entire subtree, so avoid copy.deepcopy()'s memo overhead
+    new.extend([copy(child) for child in value])
 
     return new
 
 
-@validate.register(UnionGetSchema)
+@_validate.register(UnionGetSchema)
 def _validate_uniongetschema(schema, value):
     # type: (UnionGetSchema)
     return schema.seq(
@@ -379,7 +456,7 @@ def _validate_uniongetschema(schema, value):
     )
 
 
-@validate.register(UnionSchema)
+@_validate.register(UnionSchema)
 def _validate_unionschema(schema, value):
     # type: (UnionSchema)
     try:
@@ -388,6 +465,304 @@ def _validate_unionschema(schema, value):
         raise ValidationError("Could not validate union", schema=UnionSchema, context=err)
 
 
+_validate_fast = {
+    type: _validate_type,
+    list: _validate_sequence,
+    tuple: _validate_sequence,
+    set: _validate_sequence,
+    frozenset: _validate_sequence,
+    dict: _validate_dict,
+    FunctionType: _validate_callable,
+    BuiltinFunctionType: _validate_callable,
+    MethodType: _validate_callable,
+    RE_PATTERN_TYPE: _validate_pattern,
+    Schema: _validate_allschema,
+    AllSchema: _validate_allschema,
+    AnySchema: _validate_anyschema,
+    NoneOrAllSchema: _validate_noneorallschema,
+    ListSchema: _validate_listschema,
+    RegexSchema: _validate_regexschema,
+    TransformSchema: _validate_transformschema,
+    GetItemSchema: _validate_getitemschema,
+    AttrSchema: _validate_attrschema,
+    XmlElementSchema: _validate_xmlelementschema,
+    UnionGetSchema: _validate_uniongetschema,
+    UnionSchema: _validate_unionschema,
+}
+
+
+# ----
+
+
+def _compile(schema):
+    compiler = _compilers.get(type(schema))
+    if compiler is not None:
+        return compiler(schema)
+
+    return _compile_validate(schema)
+
+
+def _compile_validate(schema):
+    # resolve the validation function of all other schema types only once
+    func = _validate_fast.get(type(schema)) or _validate.dispatch(type(schema))
+
+    def validate_schema(value):
+        return func(schema, value)
+
+    return validate_schema
+
+
+def _compile_equality(schema):
+    def validate_equality(value):
+        # only call the regular validation function for raising the error
+        if schema != value:
+            _validate(schema, value)
+
+        return value
+
+    return validate_equality
+
+
+def _compile_type(schema):
+    # the regular validation function converts unicode and long values on py2
+    if is_py2:
+        return _compile_validate(schema)
+
+    def validate_type(value):
+        if isinstance(value, schema):
+            return value
+
+        return _validate_type(schema, value)
+
+    return validate_type
+
+
+def _compile_sequence(schema):
+    cls = type(schema)
+    func = _compile_anyschema(AnySchema(*schema))
+
+    def validate_sequence(value):
+        if not isinstance(value, cls):
+            _validate_type(cls, value)
+        return cls([func(v) for v in value])
+
+    return validate_sequence
+
+
+def _compile_dict(schema):
+    cls = type(schema)
+    items = []
+
+    for key, subschema in schema.items():
+        is_optional = False
+        if type(key) not in _dict_key_literal_types and isinstance(key, OptionalSchema):
+            is_optional = True
+            key = key.key
+
+        keyfunc = _compile(key) if type(key) in _dict_key_schema_types else None
+        items.append((key, is_optional, keyfunc, _compile(subschema)))
+
+        # validation stops after the first key schema
+        if keyfunc is not None and not is_optional:
+            break
+
+    def validate_dict(value):
+        if not isinstance(value, cls):
+            _validate_type(cls, value)
+        new = cls()
+
+        for key, is_optional, keyfunc, func in items:
+            if is_optional and key not in value:
+                continue
+
+            if keyfunc is not None:
+                for subkey, subvalue in value.items():
+                    try:
+                        newkey = keyfunc(subkey)
+                    except ValidationError as err:
+                        raise ValidationError("Unable to validate key", schema=dict, context=err)
+                    try:
+                        newvalue = func(subvalue)
+                    except ValidationError as err:
+                        raise ValidationError("Unable to validate value", schema=dict, context=err)
+                    new[newkey] = newvalue
+                break
+
+            if key not in value:
+                raise ValidationError(
+                    "Key {key} not found in {value}",
+                    key=LazyRepr(key),
+                    value=LazyRepr(value),
+                    schema=dict,
+                )
+
+            try:
+                new[key] = func(value[key])
+            except ValidationError as err:
+                raise ValidationError(
+                    "Unable to validate value of key {key}",
+                    key=LazyRepr(key),
+                    schema=dict,
+                    context=err,
+                )
+
+        return new
+
+    return validate_dict
+
+
+def _compile_allschema(schema):
+    funcs = tuple(_compile(subschema) for subschema in schema.schema)
+    if len(funcs) == 1:
+        return funcs[0]
+
+    def validate_all(value):
+        for func in funcs:
+            value = func(value)
+
+        return value
+
+    return validate_all
+
+
+def _compile_anyschema(schema):
+    funcs = tuple(_compile(subschema) for subschema in schema.schema)
+    literals = schema._literals
+
+    def validate_any(value):
+        if literals is not None:
+            try:
+                if value in literals:
+                    return value
+            except TypeError:
+                pass
+
+        errors = []
+        for func in funcs:
+            try:
+                return func(value)
+            except ValidationError as err:
+                errors.append(err)
+
+        raise ValidationError(*errors, schema=AnySchema)
+
+    return validate_any
+
+
+def _compile_noneorallschema(schema):
+    funcs = tuple(_compile(subschema) for subschema in schema.schema)
+
+    def validate_noneorall(value):
+        if value is not None:
+            try:
+                for func in funcs:
+                    value = func(value)
+            except ValidationError as err:
+                raise ValidationError(err, schema=NoneOrAllSchema)
+
+        return value
+
+    return validate_noneorall
+
+
+def _compile_transformschema(schema):
+    # let the regular validation function raise the error if func is not callable
+    if not callable(schema.func):
+        return _compile_validate(schema)
+
+    func = schema.func
+    args = schema.args
+    kwargs = schema.kwargs
+
+    def validate_transform(value):
+        return func(value, *args, **kwargs)
+
+    return validate_transform
+
+
+_compilers = {
+    type(None): _compile_equality,
+    bool: _compile_equality,
+    int: _compile_equality,
+    float: _compile_equality,
+    bytes: _compile_equality,
+    str: _compile_equality,
+    text_type: _compile_equality,
+    type: _compile_type,
+    list: _compile_sequence,
+    tuple: _compile_sequence,
+    set: _compile_sequence,
+    frozenset: _compile_sequence,
+    dict: _compile_dict,
+    Schema: _compile_allschema,
+    AllSchema: _compile_allschema,
+    AnySchema: _compile_anyschema,
+    NoneOrAllSchema: _compile_noneorallschema,
+    TransformSchema: _compile_transformschema,
+}
+
+
+def _schema_key(schema):
+    # build a hashable key of the whole schema tree - raises TypeError if a part of it is not hashable
+    cls = type(schema)
+    if cls is list or cls is tuple:
+        return cls, tuple(_schema_key(item) for item in schema)
+    if cls is set or cls is frozenset:
+        return cls, frozenset(_schema_key(item) for item in schema)
+    if cls is dict:
+        return cls, tuple((_schema_key(key), _schema_key(value)) for key, value in schema.items())
+    if isinstance(schema, SchemaContainer):
+        return cls, _schema_key(schema.schema)
+    if cls is OptionalSchema:
+        return cls, _schema_key(schema.key)
+    if cls is GetItemSchema:
+        # the default value gets returned as is and must not be shared between schemas if it's mutable
+        return cls, _schema_key(schema.item), _value_key(schema.default), schema.strict
+    if cls is TransformSchema:
+        # same as the default value of GetItemSchema: the arguments get passed to the function as is
+        args = tuple(_value_key(arg) for arg in schema.args)
+        kwargs = tuple(sorted((key, _value_key(value)) for key, value in schema.kwargs.items()))
+        return cls, schema.func, args, kwargs
+    if cls is RegexSchema:
+        return cls, schema.pattern, schema.method
+    if cls is XmlElementSchema:
+        return cls, _schema_key(schema.tag), _schema_key(schema.text), _schema_key(schema.attrib), _schema_key(schema.tail)
+    if cls is UnionGetSchema:
+        return cls, _schema_key(schema.getters), schema.seq
+
+    return _value_key(schema)
+
+
+def _value_key(value):
+    hash(value)
+
+    return type(value), value
+
+
+class _SchemaKey(object):
+    __slots__ = ("schema", "key", "_hash")
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.key = _schema_key(schema)
+        self._hash = hash(self.key)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return type(other) is _SchemaKey and self.key == other.key
+
+    def __ne__(self, other):
+        return not self == other
+
+
+@lru_cache(maxsize=1024)
+def _compile_cached(key):
+    # type: (_SchemaKey)
+    return _compile(key.schema)
+
+
 # ----
 
 
@@ -416,7 +791,7 @@ def _validate_union_dict(schema, value):
 
             raise ValidationError(
                 "Unable to validate union {key}",
-                key=repr(key),
+                key=LazyRepr(key),
                 schema=dict,
                 context=err,
             )
@@ -1,9 +1,9 @@
 from typing import Any, Callable, Dict, Optional, Tuple
 
-from lxml.etree import XPathError, iselement
+from lxml.etree import Element, XPath, XPathError, iselement
 
-from streamlink.compat import urlparse
-from streamlink.plugin.api.validate._exception import ValidationError
+from streamlink.compat import lru_cache, str as text_type, urlparse
+from streamlink.plugin.api.validate._exception import LazyRepr, ValidationError
 from streamlink.plugin.api.validate._schemas import AllSchema, AnySchema, TransformSchema
 from streamlink.plugin.api.validate._validate import validate
 from streamlink.utils.parse import (
@@ -17,6 +17,29 @@ from streamlink.utils.parse import (
 # String related validators
 
 
+_str_types = (str, text_type)
+
+
+def _str_type_error(value):
+    # same error as the one raised by validate(str, value)
+    return ValidationError(
+        "Type of {value} should be {expected}, but is {actual}",
+        value=LazyRepr(value),
+        expected="str",
+        actual=type(value).__name__,
+        schema=type,
+    )
+
+
+def _str_match_error(template, value, string, schema):
+    return ValidationError(
+        template,
+        value=LazyRepr(value),
+        string=LazyRepr(string),
+        schema=schema,
+    )
+
+
 def validator_length(number):
     # type: (int) -> Callable[[str], bool]
     """
@@ -27,7 +50,7 @@ def validator_length(number):
         if len(value) < number:
             raise ValidationError(
                 "Minimum length is {number}, but value is {value}",
-                number=repr(number),
+                number=LazyRepr(number),
                 value=len(value),
                 schema="length",
             )
@@ -44,14 +67,10 @@ def validator_startswith(string):
     """
 
     def starts_with(value):
-        validate(str, value)
+        if type(value) is not str and not isinstance(value, _str_types):
+            raise _str_type_error(value)
         if not value.startswith(string):
-            raise ValidationError(
-                "{value} does not start with {string}",
-                value=repr(value),
-                string=repr(string),
-                schema="startswith",
-            )
+            raise _str_match_error("{value} does not start with {string}", value, string, "startswith")
 
         return True
 
@@ -65,14 +84,10 @@ def validator_endswith(string):
     """
 
     def ends_with(value):
-        validate(str, value)
+        if type(value) is not str and not isinstance(value, _str_types):
+            raise _str_type_error(value)
         if not value.endswith(string):
-            raise ValidationError(
-                "{value} does not end with {string}",
-                value=repr(value),
-                string=repr(string),
-                schema="endswith",
-            )
+            raise _str_match_error("{value} does not end with {string}", value, string, "endswith")
 
         return True
 
@@ -86,20 +101,33 @@ def validator_contains(string):
     """
 
     def contains_str(value):
-        validate(str, value)
+        if type(value) is not str and not isinstance(value, _str_types):
+            raise _str_type_error(value)
         if string not in value:
-            raise ValidationError(
-                "{value} does not contain {string}",
-                value=repr(value),
-                string=repr(string),
-                schema="contains",
-            )
+            raise _str_match_error("{value} does not contain {string}", value, string, "contains")
 
         return True
 
     return contains_str
 
 
+# parse results are immutable and the same URLs get validated repeatedly
+_urlparse = lru_cache(maxsize=1024)(urlparse)
+
+_url_attributes = frozenset((
+    "scheme",
+    "netloc",
+    "path",
+    "params",
+    "query",
+    "fragment",
+    "username",
+    "password",
+    "hostname",
+    "port",
+))
+
+
 def validator_url(**attributes):
     # type: (**) -> Callable[[str], bool]
     """
@@ -110,30 +138,34 @@ def validator_url(**attributes):
     if attributes.get("scheme") == "http":
         attributes["scheme"] = AnySchema("http", "https")
 
+    for name in attributes:
+        if name not in _url_attributes:
+            raise ValidationError(
+                "Invalid URL attribute {name}",
+                name=LazyRepr(name),
+                schema="url",
+            )
+
+    items = tuple(attributes.items())
+
     def check_url(value):
-        validate(str, value)
-        parsed = urlparse(value)
+        if type(value) is not str:
+            validate(str, value)
+        parsed = _urlparse(value)
         if not parsed.netloc:
             raise ValidationError(
                 "{value} is not a valid URL",
-                value=repr(value),
+                value=LazyRepr(value),
                 schema="url",
             )
 
-        for name, schema in attributes.items():
-            if not hasattr(parsed, name):
-                raise ValidationError(
-                    "Invalid URL attribute {name}",
-                    name=repr(name),
-                    schema="url",
-                )
-
+        for name, schema in items:
             try:
                 validate(schema, getattr(parsed, name))
             except ValidationError as err:
                 raise ValidationError(
                     "Unable to validate URL attribute {name}",
-                    name=repr(name),
+                    name=LazyRepr(name),
                     schema="url",
                     context=err,
                 )
@@ -176,22 +208,36 @@ def validator_hasattr(attr):
 
 
 def validator_filter(func):
-    # type: (Callable[[Any], bool]) -> TransformSchema
+    # type: (Optional[Callable[..., bool]]) -> TransformSchema
     """
     Filter out unwanted items from the input using the specified function.
 
     Supports both dicts and sequences. key/value pairs are expanded when applied to a dict.
+    If func is None or bool, falsy items (or falsy dict values) are filtered out.
     """
 
-    def expand_kv(kv):
-        return func(*kv)
+    if func is None or func is bool:
+        def filter_falsy(value):
+            cls = type(value)
+            if cls is dict:
+                return {k: v for k, v in value.items() if v}
+            if cls is list:
+                return [item for item in value if item]
+            if isinstance(value, dict):
+                return cls([(k, v) for k, v in value.items() if v])
+            return cls([item for item in value if item])
+
+        return TransformSchema(filter_falsy)
 
     def filter_values(value):
         cls = type(value)
+        if cls is dict:
+            return {k: v for k, v in value.items() if func(k, v)}
+        if cls is list:
+            return [item for item in value if func(item)]
         if isinstance(value, dict):
-            return cls(filter(expand_kv, value.items()))
-        else:
-            return cls(filter(func, value))
+            return cls([(k, v) for k, v in value.items() if func(k, v)])
+        return cls([item for item in value if func(item)])
 
     return TransformSchema(filter_values)
 
@@ -204,15 +250,13 @@ def validator_map(func):
     Supports both dicts and sequences. key/value pairs are expanded when applied to a dict.
     """
 
-    def expand_kv(kv):
-        return func(*kv)
-
     def map_values(value):
         cls = type(value)
+        if cls is list:
+            return [func(item) for item in value]
         if isinstance(value, dict):
-            return cls(map(expand_kv, value.items()))
-        else:
-            return cls(map(func, value))
+            return cls([func(k, v) for k, v in value.items()])
+        return cls([func(item) for item in value])
 
     return TransformSchema(map_values)
 
@@ -220,33 +264,42 @@ def validator_map(func):
 # lxml.etree related validators
 
 
-def validator_xml_find(
-    path,
-    namespaces=None,
-):
-    # type: (str, Optional[Dict[str, str]]) -> TransformSchema
-    """
-    Find an XML element (:meth:`Element.find`).
-    This method uses the ElementPath query language, which is a subset of XPath.
-    """
+_elementpath_probe = Element("probe")
 
-    def xpath_find(value):
-        validate(iselement, value)
 
-        try:
-            value = value.find(path, namespaces=namespaces)
-        except SyntaxError as err:
-            raise ValidationError(
-                "ElementPath syntax error: {path}",
-                path=repr(path),
-                schema="xml_find",
-                context=err,
-            )
+def _check_elementpath(path, namespaces, schema):
+    # lxml parses ElementPath queries eagerly and keeps the parsed selectors in an internal cache,
+    # so querying an empty element once reports syntax errors up front and pre-fills that cache
+    try:
+        _elementpath_probe.find(path, namespaces=namespaces)
+    except SyntaxError as err:
+        raise ValidationError(
+            "ElementPath syntax error: {path}",
+            path=LazyRepr(path),
+            schema=schema,
+            context=err,
+        )
+
+
+def _namespaces_key(namespaces):
+    # type: (Optional[Dict[str, str]]) -> Optional[frozenset]
+    return frozenset(namespaces.items()) if namespaces else None
+
 
+# validators with the same path and namespaces are shared, as their schemas are immutable
+@lru_cache(maxsize=512)
+def _validator_xml_find(path, namespaces_key):
+    namespaces = dict(namespaces_key) if namespaces_key else None
+    _check_elementpath(path, namespaces, "xml_find")
+
+    def xpath_find(value):
+        if not iselement(value):
+            validate(iselement, value)
+        value = value.find(path, namespaces=namespaces)
         if value is None:
             raise ValidationError(
                 "ElementPath query {path} did not return an element",
-                path=repr(path),
+                path=LazyRepr(path),
                 schema="xml_find",
             )
 
@@ -255,6 +308,32 @@ def validator_xml_find(
     return TransformSchema(xpath_find)
 
 
+@lru_cache(maxsize=512)
+def _validator_xml_findall(path, namespaces_key):
+    namespaces = dict(namespaces_key) if namespaces_key else None
+    _check_elementpath(path, namespaces, "xml_findall")
+
+    def xpath_findall(value):
+        if not iselement(value):
+            validate(iselement, value)
+        return value.findall(path, namespaces=namespaces)
+
+    return TransformSchema(xpath_findall)
+
+
+def validator_xml_find(
+    path,
+    namespaces=None,
+):
+    # type: (str, Optional[Dict[str, str]]) -> TransformSchema
+    """
+    Find an XML element (:meth:`Element.find`).
+    This method uses the ElementPath query language, which is a subset of XPath.
+    """
+
+    return _validator_xml_find(path, _namespaces_key(namespaces))
+
+
 def validator_xml_findall(
     path,
     namespaces=None,
@@ -265,11 +344,7 @@ def validator_xml_findall(
     This method uses the ElementPath query language, which is a subset of XPath.
     """
 
-    def xpath_findall(value):
-        validate(iselement, value)
-        return value.findall(path, namespaces=namespaces)
-
-    return TransformSchema(xpath_findall)
+    return _validator_xml_findall(path, _namespaces_key(namespaces))
 
 
 def validator_xml_findtext(
@@ -299,23 +374,31 @@ def validator_xml_xpath(
     Query XML elements via XPath (:meth:`Element.xpath`) and return None if the result is falsy.
     """
 
+    def xpath_error(err):
+        return ValidationError(
+            "XPath evaluation error: {xpath}",
+            xpath=LazyRepr(xpath),
+            schema="xml_xpath",
+            context=err
+        )
+
+    try:
+        compiled = XPath(
+            xpath,
+            namespaces=namespaces,
+            extensions=extensions,
+            smart_strings=smart_strings,
+        )
+    except XPathError as err:
+        raise xpath_error(err)
+
     def transform_xpath(value):
-        validate(iselement, value)
+        if not iselement(value):
+            validate(iselement, value)
         try:
-            result = value.xpath(
-                xpath,
-                namespaces=namespaces,
-                extensions=extensions,
-                smart_strings=smart_strings,
-                **variables
-            )
+            result = compiled(value, **variables)
         except XPathError as err:
-            raise ValidationError(
-                "XPath evaluation error: {xpath}",
-                xpath=repr(xpath),
-                schema="xml_xpath",
-                context=err
-            )
+            raise xpath_error(err)
 
         return result or None
 
@@ -346,12 +429,22 @@ def validator_xml_xpath_string(
 # Parse utility related validators
 
 
+# shared schema instances of the parse validators without any custom arguments
+_parse_json_default = TransformSchema(_parse_json, exception=ValidationError, schema=None)
+_parse_html_default = TransformSchema(_parse_html, exception=ValidationError, schema=None)
+_parse_xml_default = TransformSchema(_parse_xml, exception=ValidationError, schema=None)
+_parse_qsd_default = TransformSchema(_parse_qsd, exception=ValidationError, schema=None)
+
+
 def validator_parse_json(*args, **kwargs):
     # type: () -> TransformSchema
     """
     Parse JSON data via the :func:`streamlink.utils.parse.parse_json` utility function.
     """
 
+    if not args and not kwargs:
+        return _parse_json_default
+
     return TransformSchema(_parse_json, exception=ValidationError, schema=None, *args, **kwargs)
 
 
@@ -361,6 +454,9 @@ def validator_parse_html(*args, **kwargs):
     Parse HTML data via the :func:`streamlink.utils.parse.parse_html` utility function.
     """
 
+    if not args and not kwargs:
+        return _parse_html_default
+
     return TransformSchema(_parse_html, exception=ValidationError, schema=None, *args, **kwargs)
 
 
@@ -370,6 +466,9 @@ def validator_parse_xml(*args, **kwargs):
     Parse XML data via the :func:`streamlink.utils.parse.parse_xml` utility function.
     """
 
+    if not args and not kwargs:
+        return _parse_xml_default
+
     return TransformSchema(_parse_xml, exception=ValidationError, schema=None, *args, **kwargs)
 
 
@@ -379,4 +478,7 @@ def validator_parse_qsd(*args, **kwargs):
     Parse a query string via the :func:`streamlink.utils.parse.parse_qsd` utility function.
     """
 
+    if not args and not kwargs:
+        return _parse_qsd_default
+
     return TransformSchema(_parse_qsd, exception=ValidationError, schema=None, *args, **kwargs)
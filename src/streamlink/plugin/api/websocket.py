@@ -2,12 +2,13 @@ from __future__ import absolute_import
 
 import json
 import logging
-from threading import RLock, Thread, current_thread
-from typing import Any, Dict, List, Optional, Tuple, Union
+from itertools import count
+from threading import Lock, Thread, current_thread
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from websocket import ABNF, STATUS_NORMAL, WebSocketApp, enableTrace
 
-from streamlink.compat import is_py2, str, unquote_plus, urlparse
+from streamlink.compat import lru_cache, str, unquote_plus, urlparse
 from streamlink.logger import TRACE, root as rootlogger
 from streamlink.session import Streamlink
 
@@ -15,6 +16,22 @@ from streamlink.session import Streamlink
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _proxy_options(http_proxy):
+    # type: (str) -> Tuple[Tuple[str, Any], ...]
+    p = urlparse(http_proxy)
+    proxy_options = [
+        ("proxy_type", p.scheme),
+        ("http_proxy_host", p.hostname),
+    ]
+    if p.port:  # pragma: no branch
+        proxy_options.append(("http_proxy_port", p.port))
+    if p.username:  # pragma: no branch
+        proxy_options.append(("http_proxy_auth", (unquote_plus(p.username), unquote_plus(p.password or ""))))
+
+    return tuple(proxy_options)
+
+
 class WebsocketClient(Thread):
     OPCODE_CONT = ABNF.OPCODE_CONT      # type: int
     OPCODE_TEXT = ABNF.OPCODE_TEXT      # type: int
@@ -23,7 +40,7 @@ class WebsocketClient(Thread):
     OPCODE_PING = ABNF.OPCODE_PING      # type: int
     OPCODE_PONG = ABNF.OPCODE_PONG      # type: int
 
-    _id = 0     # type: int
+    _id = count(1)  # type: Iterator[int]
 
     ws = None   # type: WebSocketApp
 
@@ -59,27 +76,10 @@ class WebsocketClient(Thread):
 
         if not header:
             header = []
-        if not any(True for h in header if h.startswith("User-Agent: ")):
+        if not any(h.startswith("User-Agent: ") for h in header):
             header.append("User-Agent: {0}".format(session.http.headers['User-Agent']))
 
-        proxy_options = {}
-        http_proxy = session.get_option("http-proxy")
-        # type: Optional[str]
-        if http_proxy:
-            p = urlparse(http_proxy)
-            proxy_options["proxy_type"] = p.scheme
-            proxy_options["http_proxy_host"] = p.hostname
-            if p.port:  # pragma: no branch
-                proxy_options["http_proxy_port"] = p.port
-            if p.username:  # pragma: no branch
-                proxy_options["http_proxy_auth"] = unquote_plus(p.username), unquote_plus(p.password or "")
-
-        self._reconnect = False
-        self._reconnect_lock = RLock()
-
-        self.session = session
-        self._ws_init(url, subprotocols, header, cookie)
-        self._ws_rundata = dict(
+        self._ws_rundata = rundata = dict(
             sockopt=sockopt,
             sslopt=sslopt,
             host=host,
@@ -87,12 +87,21 @@ class WebsocketClient(Thread):
             suppress_origin=suppress_origin,
             ping_interval=ping_interval,
             ping_timeout=ping_timeout,
-            **proxy_options
         )
 
-        self._id += 1
+        http_proxy = session.get_option("http-proxy")
+        # type: Optional[str]
+        if http_proxy:
+            rundata.update(_proxy_options(http_proxy))
+
+        self._reconnect = False
+        self._reconnect_lock = Lock()
+
+        self.session = session
+        self._ws_init(url, subprotocols, header, cookie)
+
         super(WebsocketClient, self).__init__(
-            name="Thread-{0}-{1}".format(self.__class__.__name__, self._id)
+            name="Thread-{0}-{1}".format(self.__class__.__name__, next(self._id))
         )
         self.daemon = True
 
@@ -148,13 +157,10 @@ class WebsocketClient(Thread):
                 cookie=self.ws.cookie if cookie is None else cookie
             )
 
-    def close(self, status=STATUS_NORMAL, reason="", timeout=3):
+    def close(self, status=STATUS_NORMAL, reason=b"", timeout=3):
         # type: (int, Union[str, bytes], int) -> None
-        if type(reason) is str:
-            if is_py2:
-                reason = bytes(reason)
-            else:
-                reason = bytes(reason, encoding="utf-8")
+        if isinstance(reason, str):
+            reason = reason.encode("utf-8")
         self.ws.close(status=status, reason=reason, timeout=timeout)
         if self.is_alive() and current_thread() is not self:
             self.join()
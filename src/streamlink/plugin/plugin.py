@@ -6,12 +6,12 @@ import time
 from collections import OrderedDict, namedtuple
 from functools import partial
 from http.cookiejar import Cookie
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Pattern, Sequence, Type, Union
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Pattern, Sequence, Tuple, Type, Union
 
 import requests.cookies
 
 from streamlink.cache import Cache
-from streamlink.compat import str
+from streamlink.compat import lru_cache, str
 from streamlink.exceptions import FatalPluginError, NoStreamsError, PluginError
 from streamlink.options import Argument, Arguments, Options
 from streamlink.user_input import UserInputRequester
@@ -50,6 +50,13 @@ FILTER_OPERATORS = {
 
 PARAMS_REGEX = r"(\w+)=({.+?}|\[.+?\]|\(.+?\)|'(?:[^'\\]|\\')*'|\"(?:[^\"\\]|\\\")*\"|\S+)"
 
+_PARAMS_RE = re.compile(PARAMS_REGEX)
+# first characters of values which can be Python literals: containers, (prefixed) strings, numbers, True/False/None
+_PARAMS_LITERAL_START = frozenset("{[('\"+-.0123456789TFNbBuUrR")
+_FILTER_RE = re.compile(r"(?P<op><=|>=|<|>)?(?P<value>[\w+]+)")
+_STREAM_WEIGHT_RE = re.compile(r"^(\d+)(k|p)?(\d+)?(\+)?(?:[a_](\d+)k)?(?:_(alt)(\d)?)?$")
+_STREAM_NAME_RE = re.compile(r"[A-z0-9_+]+")
+
 HIGH_PRIORITY = 30
 NORMAL_PRIORITY = 20
 LOW_PRIORITY = 10
@@ -59,12 +66,14 @@ _COOKIE_KEYS = \
     "version", "name", "value", "port", "domain", "path", "secure", "expires", "discard", "comment", "comment_url", "rfc2109"
 
 
+# the number of distinct stream names is small, and each name gets weighted multiple times when sorting streams
+@lru_cache(maxsize=512)
 def stream_weight(stream):
     for group, weights in QUALITY_WEIGTHS_EXTRA.items():
         if stream in weights:
             return weights[stream], group
 
-    match = re.match(r"^(\d+)(k|p)?(\d+)?(\+)?(?:[a_](\d+)k)?(?:_(alt)(\d)?)?$", stream)
+    match = _STREAM_WEIGHT_RE.match(stream)
 
     if match:
         weight = 0
@@ -108,22 +117,21 @@ def iterate_streams(streams):
             yield (name, stream)
 
 
-def stream_type_priority(stream_types, stream):
-    stream_type = type(stream[1]).shortname()
+def stream_type_priorities(stream_types):
+    # map each stream type to the index of its first occurrence
+    priorities = {}
+    for prio, stream_type in enumerate(stream_types):
+        priorities.setdefault(stream_type, prio)
+
+    return priorities
 
-    try:
-        prio = stream_types.index(stream_type)
-    except ValueError:
-        try:
-            prio = stream_types.index("*")
-        except ValueError:
-            prio = 99
 
-    return prio
+def stream_type_priority(priorities, default, stream):
+    return priorities.get(stream[2], default)
 
 
 def stream_sorting_filter(expr, stream_weight):
-    match = re.match(r"(?P<op><=|>=|<|>)?(?P<value>[\w+]+)", expr)
+    match = _FILTER_RE.match(expr)
 
     if not match:
         raise PluginError("Invalid filter expression: {0}".format(expr))
@@ -156,13 +164,14 @@ def parse_params(params=None):
     if not params:
         return rval
 
-    matches = re.findall(PARAMS_REGEX, params)
+    matches = _PARAMS_RE.findall(params)
 
     for key, value in matches:
-        try:
-            value = ast.literal_eval(value)
-        except Exception:
-            pass
+        if value[0] in _PARAMS_LITERAL_START:
+            try:
+                value = ast.literal_eval(value)
+            except Exception:
+                pass
 
         rval[key] = value
 
@@ -231,9 +240,17 @@ class Plugin(object):
         # type: (str)
         self._url = value
 
-        matches = [(pattern, pattern.match(value)) for pattern, priority in self.matchers or []]
-        self.matches = tuple(m for p, m in matches)
-        self.matcher, self.match = next(((p, m) for p, m in matches if m is not None), (None, None))
+        matches = []
+        matcher = match = None
+        for pattern, priority in self.matchers or ():
+            m = pattern.match(value)
+            matches.append(m)
+            if match is None and m is not None:
+                matcher, match = pattern, m
+
+        self.matches = tuple(matches)
+        self.matcher = matcher
+        self.match = match
 
     def __init__(self, *args, **kwargs):
         # type: (str) -> None
@@ -246,6 +263,12 @@ class Plugin(object):
 
     @classmethod
     def set_option(cls, key, value):
+        # don't write to the Options instance which is shared by all plugins without their own options
+        # but keep the inherited defaults and values
+        if "options" not in cls.__dict__:
+            options = Options(cls.options.defaults)
+            options.update(cls.options.options)
+            cls.options = options
         cls.options.set(key, value)
 
     @classmethod
@@ -327,32 +350,39 @@ class Plugin(object):
         if stream_types is None:
             stream_types = self.default_stream_types(ostreams)
 
+        # Look up the type name of each stream only once
+        flat_streams = [(name, stream, type(stream).shortname()) for name, stream in iterate_streams(ostreams)]
+
         # Add streams depending on stream type and priorities
-        sorted_streams = sorted(iterate_streams(ostreams),
+        priorities = stream_type_priorities(stream_types)
+        sorted_streams = sorted(flat_streams,
                                 key=partial(stream_type_priority,
-                                            stream_types))
+                                            priorities,
+                                            priorities.get("*", 99)))
 
         streams = {}
-        for name, stream in sorted_streams:
-            stream_type = type(stream).shortname()
+        streams_types = {}
+        alt_counts = {}
+        for name, stream, stream_type in sorted_streams:
+            alt_name = None
 
             # Use * as wildcard to match other stream types
-            if "*" not in stream_types and stream_type not in stream_types:
+            if "*" not in priorities and stream_type not in priorities:
                 continue
 
             # drop _alt from any stream names
             if name.endswith("_alt"):
-                name = name[:-len("_alt")]
+                name = name[:-4]
 
             existing = streams.get(name)
             if existing:
-                existing_stream_type = type(existing).shortname()
+                existing_stream_type = streams_types[name]
                 if existing_stream_type != stream_type:
                     name = "{0}_{1}".format(name, stream_type)
 
                 if name in streams:
-                    name = "{0}_alt".format(name)
-                    num_alts = len(list(filter(lambda n: n.startswith(name), streams.keys())))
+                    name = alt_name = "{0}_alt".format(name)
+                    num_alts = alt_counts.get(alt_name, 0)
 
                     # We shouldn't need more than 2 alt streams
                     if num_alts >= 2:
@@ -361,23 +391,27 @@ class Plugin(object):
                         name = "{0}{1}".format(name, num_alts + 1)
 
             # Validate stream name and discard the stream if it's bad.
-            match = re.match("([A-z0-9_+]+)", name)
+            match = _STREAM_NAME_RE.match(name)
             if match:
-                name = match.group(1)
+                name = match.group(0)
             else:
                 self.logger.debug("The stream '{0}' has been ignored "
                                   "since it is badly named.", name)
                 continue
 
             # Force lowercase name and replace space with underscore.
-            streams[name.lower()] = stream
+            name = name.lower()
+            streams[name] = stream
+            streams_types[name] = stream_type
+            if alt_name is not None:
+                alt_counts[alt_name] = alt_counts.get(alt_name, 0) + 1
 
         # Create the best/worst synonyms
-        def stream_weight_only(s):
-            return (self.stream_weight(s)[0] or (len(streams) == 1 and 1))
+        single_stream = len(streams) == 1
+        weights = {name: self.stream_weight(name)[0] or (single_stream and 1) for name in streams}
 
-        stream_names = filter(stream_weight_only, streams.keys())
-        sorted_streams = sorted(stream_names, key=stream_weight_only)
+        stream_names = [name for name in streams if weights[name]]
+        sorted_streams = sorted(stream_names, key=weights.__getitem__)
         unfiltered_sorted_streams = sorted_streams
 
         if isinstance(sorting_excludes, list):
@@ -389,7 +423,7 @@ class Plugin(object):
 
         final_sorted_streams = OrderedDict()
 
-        for stream_name in sorted(streams, key=stream_weight_only):
+        for stream_name in sorted(streams, key=weights.__getitem__):
             final_sorted_streams[stream_name] = streams[stream_name]
 
         if len(sorted_streams) > 0:
@@ -453,18 +487,19 @@ class Plugin(object):
         if not self.session or not self.cache:
             raise RuntimeError("Cannot cache cookies in unbound plugin")
 
-        cookie_filter = cookie_filter or (lambda c: True)
+        cookies = self.session.http.cookies
+        if cookie_filter:
+            cookies = filter(cookie_filter, cookies)
         saved = []
+        now = time.time()
 
-        for cookie in filter(cookie_filter, self.session.http.cookies):
-            cookie_dict = {}
-            for key in _COOKIE_KEYS:
-                cookie_dict[key] = getattr(cookie, key, None)
+        for cookie in cookies:
+            cookie_dict = {key: getattr(cookie, key, None) for key in _COOKIE_KEYS}
             cookie_dict["rest"] = getattr(cookie, "rest", getattr(cookie, "_rest", None))
 
             expires = default_expires
             if cookie_dict["expires"]:
-                expires = int(cookie_dict["expires"] - time.time())
+                expires = int(cookie_dict["expires"] - now)
             key = "__cookie:{0}:{1}:{2}:{3}".format(
                 cookie.name,
                 cookie.domain,
@@ -479,6 +514,10 @@ class Plugin(object):
 
         return saved
 
+    def _get_cached_cookies(self):
+        # type: () -> List[Tuple[str, Dict[str, Any]]]
+        return [(key, value) for key, value in self.cache.get_all().items() if key.startswith("__cookie")]
+
     def load_cookies(self):
         """
         Load any stored cookies for the plugin that have not expired.
@@ -490,11 +529,10 @@ class Plugin(object):
 
         restored = []
 
-        for key, value in self.cache.get_all().items():
-            if key.startswith("__cookie"):
-                cookie = requests.cookies.create_cookie(**value)
-                self.session.http.cookies.set_cookie(cookie)
-                restored.append(cookie.name)
+        for key, value in self._get_cached_cookies():
+            cookie = requests.cookies.create_cookie(**value)
+            self.session.http.cookies.set_cookie(cookie)
+            restored.append(cookie.name)
 
         if restored:  # pragma: no branch
             self.logger.debug("Restored cookies: {0}".format(', '.join(restored)))
@@ -513,16 +551,14 @@ class Plugin(object):
         if not self.session or not self.cache:
             raise RuntimeError("Cannot clear cached cookies in unbound plugin")
 
-        cookie_filter = cookie_filter or (lambda c: True)
         removed = []
 
-        for key, value in sorted(self.cache.get_all().items(), key=operator.itemgetter(0), reverse=True):
-            if key.startswith("__cookie"):
-                cookie = requests.cookies.create_cookie(**value)
-                if cookie_filter(cookie):
-                    del self.session.http.cookies[cookie.name]
-                    self.cache.set(key, None, 0)
-                    removed.append(key)
+        for key, value in sorted(self._get_cached_cookies(), key=operator.itemgetter(0), reverse=True):
+            cookie = requests.cookies.create_cookie(**value)
+            if not cookie_filter or cookie_filter(cookie):
+                del self.session.http.cookies[cookie.name]
+                self.cache.set(key, None, 0)
+                removed.append(key)
 
         return removed
 
@@ -6,6 +6,7 @@ $type live, vod
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from streamlink.plugin import Plugin, pluginmatcher
 from streamlink.plugin.api import validate
@@ -23,27 +24,62 @@ log = logging.getLogger(__name__)
     )
 """, re.VERBOSE))
 class Aloula(Plugin):
-    def get_live(self, live_slug):
-        live_data = self.session.http.get(
-            "https://aloula.faulio.com/api/v1/channels",
-            schema=validate.Schema(
-                validate.parse_json(),
-                [{
-                    "id": int,
-                    "url": validate.text,
+    CHANNELS_CACHE_TIME = 300
+
+    _schema_channels = validate.Schema(
+        validate.parse_json(),
+        [{
+            "id": int,
+            "url": validate.text,
+            "title": validate.text,
+            "has_live": bool,
+            "has_vod": bool,
+            "streams": {
+                "hls": validate.url(),
+            },
+        }],
+    )
+
+    _schema_vod = validate.Schema(
+        validate.parse_json(),
+        validate.any(
+            validate.all(
+                {"blocks": [{
+                    "id": validate.text,
+                    "program_title": validate.text,
                     "title": validate.text,
-                    "has_live": bool,
-                    "has_vod": bool,
-                    "streams": {
-                        "hls": validate.url(),
-                    },
-                }],
-                validate.filter(lambda k: k["url"] == live_slug),
+                    "season_number": int,
+                    "episode": int,
+                }]},
+                validate.get(("blocks", 0)),
             ),
+            {"cms_error": validate.text, "message": validate.text},
+        ),
+    )
+
+    _schema_player = validate.Schema(
+        validate.parse_json(),
+        {"settings": {"protocols": {"hls": validate.url()}}},
+        validate.get(("settings", "protocols", "hls")),
+    )
+
+    def get_channels(self):
+        channels = self.cache.get("channels")
+        if channels is not None:
+            return channels
+
+        channels = self.session.http.get(
+            "https://aloula.faulio.com/api/v1/channels",
+            schema=self._schema_channels,
         )
+        self.cache.set("channels", channels, expires=self.CHANNELS_CACHE_TIME)
+
+        return channels
+
+    def get_live(self, live_slug):
+        live_data = next((channel for channel in self.get_channels() if channel["url"] == live_slug), None)
         if not live_data:
             return
-        live_data = live_data[0]
         log.trace("{0!r}".format(live_data))
 
         if not live_data["has_live"]:
@@ -56,49 +92,37 @@ class Aloula(Plugin):
         self.category = "Live"
         return HLSStream.parse_variant_playlist(self.session, live_data["streams"]["hls"])
 
-    def get_vod(self, vod_id):
-        vod_data = self.session.http.get(
-            "https://aloula.faulio.com/api/v1/video/{0}".format(vod_id),
-            acceptable_status=(200, 401),
-            schema=validate.Schema(
-                validate.parse_json(),
-                validate.any(
-                    validate.all(
-                        {"blocks": [{
-                            "id": validate.text,
-                            "program_title": validate.text,
-                            "title": validate.text,
-                            "season_number": int,
-                            "episode": int,
-                        }]},
-                        validate.get(("blocks", 0)),
-                    ),
-                    {"cms_error": validate.text, "message": validate.text},
-                ),
-            ),
+    def get_vod_hls_url(self, vod_id):
+        return self.session.http.get(
+            "https://aloula.faulio.com/api/v1/video/{0}/player".format(vod_id),
+            schema=self._schema_player,
         )
 
-        log.trace("{0!r}".format(vod_data))
-        if "cms_error" in vod_data and vod_data["cms_error"] == "auth":
-            log.error("This stream requires a login; specify appropriate Authorization and profile HTTP headers")
-            return
-        if "cms_error" in vod_data:
-            log.error("API error: {0} ({1})".format(vod_data['cms_error'], vod_data['message']))
-            return
-        self.id = vod_data["id"]
-        self.author = vod_data["program_title"]
-        self.title = vod_data["title"]
-        self.category = "S{0}E{1}".format(vod_data['season_number'], vod_data['episode'])
+    def get_vod(self, vod_id):
+        # request the player data in the background while the video metadata is being retrieved
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            hls_url = executor.submit(self.get_vod_hls_url, vod_id)
 
-        hls_url = self.session.http.get(
-            "https://aloula.faulio.com/api/v1/video/{0}/player".format(vod_id),
-            schema=validate.Schema(
-                validate.parse_json(),
-                {"settings": {"protocols": {"hls": validate.url()}}},
-                validate.get(("settings", "protocols", "hls")),
-            ),
-        )
-        return HLSStream.parse_variant_playlist(self.session, hls_url)
+            vod_data = self.session.http.get(
+                "https://aloula.faulio.com/api/v1/video/{0}".format(vod_id),
+                acceptable_status=(200, 401),
+                schema=self._schema_vod,
+            )
+
+            log.trace("{0!r}".format(vod_data))
+            # the result of the player data request gets discarded on errors
+            if "cms_error" in vod_data and vod_data["cms_error"] == "auth":
+                log.error("This stream requires a login; specify appropriate Authorization and profile HTTP headers")
+                return
+            if "cms_error" in vod_data:
+                log.error("API error: {0} ({1})".format(vod_data['cms_error'], vod_data['message']))
+                return
+            self.id = vod_data["id"]
+            self.author = vod_data["program_title"]
+            self.title = vod_data["title"]
+            self.category = "S{0}E{1}".format(vod_data['season_number'], vod_data['episode'])
+
+            return HLSStream.parse_variant_playlist(self.session, hls_url.result())
 
     def _get_streams(self):
         live_slug = self.match.group("live_slug")
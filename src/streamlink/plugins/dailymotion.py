@@ -19,7 +19,7 @@ log = logging.getLogger(__name__)
 @pluginmatcher(re.compile(r"""
     https?://(?:\w+\.)?dailymotion\.com
     (?:
-        (/embed)?/(video|live)/(?P<media_id>[^_?/]+)
+        (?:/embed)?/(?:video|live)/(?P<media_id>[^_?/]+)
         |
         /(?P<user>[\w-]+)
     )
@@ -28,6 +28,8 @@ class DailyMotion(Plugin):
     _URL_API_USER_VIDEO = "https://api.dailymotion.com/user/{user}/videos"
     _URL_STREAM_INFO = "https://www.dailymotion.com/player/metadata/video/{media_id}"
 
+    _re_fps = re.compile(r"@\d+")
+
     def _get_streams_from_media(self, media_id):
         media = self.session.http.get(
             self._URL_STREAM_INFO.format(media_id=media_id),
@@ -61,27 +63,30 @@ class DailyMotion(Plugin):
         error = media.get("error")
         if error:
             if error.get("type") == "not_found":
-                log.error("Unknown media ID: {0}".format(media_id))
+                log.error("Unknown media ID: {0}", media_id)
             else:
-                log.error("Failed to get stream: {0}".format(error['title']))
+                log.error("Failed to get stream: {0}", error['title'])
             return
 
         self.id = media_id
         self.author = media["owner.username"]
         self.title = media["title"]
 
+        hls_urls = set()
         for quality, streams in media["qualities"].items():
+            resolution = None
             for stream in streams:
                 if stream["type"] == "application/x-mpegURL":
-                    if quality != "auto":
-                        # Avoid duplicate HLS streams with bitrate selector in the URL query
+                    # Avoid duplicate HLS streams with bitrate selector in the URL query
+                    if quality != "auto" or stream["url"] in hls_urls:
                         continue
+                    hls_urls.add(stream["url"])
                     for s in HLSStream.parse_variant_playlist(self.session, stream["url"]).items():
                         yield s
                 elif stream["type"] == "video/mp4":
-                    # Drop FPS in quality
-                    quality = re.sub(r"@\d+", "", quality)
-                    resolution = "{0}p".format(quality)
+                    if resolution is None:
+                        # Drop FPS in quality
+                        resolution = "{0}p".format(self._re_fps.sub("", quality))
                     yield resolution, HTTPStream(self.session, stream["url"])
 
     def _get_media_id(self, user):
@@ -108,11 +113,11 @@ class DailyMotion(Plugin):
         )
 
         if data.get("error"):
-            log.error("Error while retrieving media ID: {0}".format(data['error']['message']))
+            log.error("Error while retrieving media ID: {0}", data['error']['message'])
             return
 
         if not data["list"]:
-            log.error("No live streams found for channel {0}".format(user))
+            log.error("No live streams found for channel {0}", user)
             return
 
         return data["list"][0]["id"]
@@ -125,7 +130,7 @@ class DailyMotion(Plugin):
             media_id = self._get_media_id(user)
 
         if media_id:
-            log.debug("Found media ID: {0}".format(media_id))
+            log.debug("Found media ID: {0}", media_id)
             return self._get_streams_from_media(media_id)
 
 
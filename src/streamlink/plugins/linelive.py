@@ -39,8 +39,9 @@ class LineLive(Plugin):
         )
         streams = {"LIVE": liveUrls, "FINISHED": vodUrls}.get(status, {})
 
-        if streams.get("abr"):
-            return HLSStream.parse_variant_playlist(self.session, streams.get("abr"))
+        abr = streams.get("abr")
+        if abr:
+            return HLSStream.parse_variant_playlist(self.session, abr)
 
         return {
             "{0}p".format(quality): HLSStream(self.session, url)
@@ -6,9 +6,11 @@ $type live, vod
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from time import time
 from uuid import uuid4
 
+from streamlink.logger import TRACE
 from streamlink.plugin import Plugin, pluginmatcher
 from streamlink.plugin.api import validate
 from streamlink.stream.hls import HLSStream
@@ -47,13 +49,69 @@ class MildomHLSStream(HLSStream):
 
 
 class MildomAPI:
+    _schema_vod_streams_data = validate.Schema(validate.parse_json(), {
+        "code": int,
+        validate.optional("message"): validate.text,
+        validate.optional("body"): {
+            "playback": {
+                "video_link": [{"name": validate.text, "url": validate.url()}],
+            },
+        },
+    })
+
+    _schema_token = validate.Schema(
+        validate.parse_json(),
+        {
+            "code": int,
+            validate.optional("message"): validate.text,
+            validate.optional("body"): {
+                "data": [
+                    {"token": validate.text, }
+                ],
+            }
+        }
+    )
+
+    _schema_server = validate.Schema(
+        validate.parse_json(),
+        {
+            "code": int,
+            validate.optional("message"): validate.text,
+            validate.optional("body"): {
+                "stream_server": validate.url(),
+            }
+        }
+    )
+
+    _schema_live_streams_data = validate.Schema(
+        validate.parse_json(),
+        {
+            "code": int,
+            validate.optional("message"): validate.text,
+            validate.optional("body"): {
+                validate.optional("status"): int,
+                "anchor_live": int,
+                validate.optional("live_type"): int,
+                "ext": {
+                    "cmode_params": [{
+                        "cmode": validate.text,
+                        "name": validate.text,
+                    }],
+                    validate.optional("live_mode"): int,
+                },
+            },
+        },
+    )
+
     def __init__(self, session, channel_id=None, video_id=None):
         self.session = session
         self.channel_id = channel_id
         self.video_id = video_id
 
     def _is_api_error(self, data):
-        log.trace("{0!r}".format(data))
+        # don't pass the response as a lazy log argument: a dict would be mistaken for a mapping of named arguments
+        if log.isEnabledFor(TRACE):
+            log.trace("{0!r}".format(data))
         if data["code"] != 0:
             log.debug(data.get("message", "Mildom API returned an error"))
             return True
@@ -68,15 +126,7 @@ class MildomAPI:
                 "__platform": "web",
                 "v_id": self.video_id,
             },
-            schema=validate.Schema(validate.parse_json(), {
-                "code": int,
-                validate.optional("message"): validate.text,
-                validate.optional("body"): {
-                    "playback": {
-                        "video_link": [{"name": validate.text, "url": validate.url()}],
-                    },
-                },
-            })
+            schema=self._schema_vod_streams_data
         )
         if self._is_api_error(data):
             return
@@ -94,18 +144,7 @@ class MildomAPI:
             },
             headers={"Accept-Language": "en"},
             json={"host_id": self.channel_id, "type": "hls"},
-            schema=validate.Schema(
-                validate.parse_json(),
-                {
-                    "code": int,
-                    validate.optional("message"): validate.text,
-                    validate.optional("body"): {
-                        "data": [
-                            {"token": validate.text, }
-                        ],
-                    }
-                }
-            )
+            schema=self._schema_token
         )
         if self._is_api_error(data):
             return
@@ -123,16 +162,7 @@ class MildomAPI:
                 "live_server_type": "hls",
             },
             headers={"Accept-Language": "en"},
-            schema=validate.Schema(
-                validate.parse_json(),
-                {
-                    "code": int,
-                    validate.optional("message"): validate.text,
-                    validate.optional("body"): {
-                        "stream_server": validate.url(),
-                    }
-                }
-            )
+            schema=self._schema_server
         )
         if self._is_api_error(data):
             return
@@ -149,25 +179,7 @@ class MildomAPI:
                 "user_id": self.channel_id,
             },
             headers={"Accept-Language": "en"},
-            schema=validate.Schema(
-                validate.parse_json(),
-                {
-                    "code": int,
-                    validate.optional("message"): validate.text,
-                    validate.optional("body"): {
-                        validate.optional("status"): int,
-                        "anchor_live": int,
-                        validate.optional("live_type"): int,
-                        "ext": {
-                            "cmode_params": [{
-                                "cmode": validate.text,
-                                "name": validate.text,
-                            }],
-                            validate.optional("live_mode"): int,
-                        },
-                    },
-                },
-            )
+            schema=self._schema_live_streams_data
         )
         if self._is_api_error(data):
             return
@@ -178,7 +190,7 @@ class MildomAPI:
 @pluginmatcher(re.compile(r"""
     https?://(?:www\.)?mildom\.com/
     (?:
-        playback/(\d+)(/(?P<video_id>(\d+)-(\w+)))
+        playback/\d+/(?P<video_id>\d+-\w+)
         |
         (?P<channel_id>\d+)
     )
@@ -205,8 +217,11 @@ class Mildom(Plugin):
             for quality_info in data["ext"]["cmode_params"]:
                 qualities.append((quality_info["name"], "_" + quality_info["cmode"] if quality_info["cmode"] != "raw" else ""))
 
-            server = api.get_server()
-            token = api.get_token()
+            # the server and token requests are independent of each other
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                token = executor.submit(api.get_token)
+                server = api.get_server()
+                token = token.result()
             self.session.http.headers.update({"Referer": "https://www.mildom.com/"})
             for quality in qualities:
                 yield quality[0], MildomHLSStream(self.session, api, server, token, quality[1])
@@ -7,6 +7,8 @@ $region Spain
 
 import logging
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from streamlink.plugin import Plugin, pluginmatcher
 from streamlink.plugin.api import validate
@@ -17,6 +19,11 @@ from streamlink.utils.url import update_qsd
 log = logging.getLogger(__name__)
 
 
+def _quote_via(string, *_, **__):
+    # don't quote the query string keys and values of the CDN tokens
+    return string
+
+
 @pluginmatcher(re.compile(
     r"https?://(?:www\.)?mitele\.es/directo/(?P<channel>[\w-]+)"
 ))
@@ -28,56 +35,79 @@ class Mitele(Plugin):
         4038: "User has no privileges",
     }
 
-    def _get_streams(self):
-        channel = self.match.group("channel")
-
-        pdata = self.session.http.get(
-            self.URL_CARONTE.format(channel=channel),
-            acceptable_status=(200, 403, 404),
-            schema=validate.Schema(
-                validate.parse_json(),
-                validate.any(
-                    {"code": int},
-                    {
-                        "cerbero": validate.url(),
-                        "bbx": validate.text,
-                        "dls": validate.all(
-                            [{
-                                "drm": bool,
-                                "format": validate.text,
-                                "stream": validate.all(
-                                    validate.transform(validate.text.strip),
-                                    validate.url(),
-                                ),
-                                "lid": validate.all(
-                                    int,
-                                    validate.transform(validate.text),
-                                ),
-                                validate.optional("assetKey"): validate.text,
-                            }],
-                            validate.filter(lambda obj: obj["format"] == "hls"),
+    _schema_pdata = validate.Schema(
+        validate.parse_json(),
+        validate.any(
+            {"code": int},
+            {
+                "cerbero": validate.url(),
+                "bbx": validate.text,
+                "dls": validate.all(
+                    [{
+                        "drm": bool,
+                        "format": validate.text,
+                        "stream": validate.all(
+                            validate.transform(validate.text.strip),
+                            validate.url(),
+                        ),
+                        "lid": validate.all(
+                            int,
+                            validate.transform(validate.text),
                         ),
-                    },
+                        validate.optional("assetKey"): validate.text,
+                    }],
+                    validate.filter(lambda obj: obj["format"] == "hls"),
                 ),
+            },
+        ),
+    )
+
+    _schema_gbx = validate.Schema(
+        validate.parse_json(),
+        {"gbx": validate.text},
+        validate.get("gbx"),
+    )
+
+    _schema_tokens = validate.Schema(
+        validate.parse_json(),
+        validate.any(
+            {"code": int},
+            validate.all(
+                {"tokens": {validate.text: {"cdn": validate.text}}},
+                validate.get("tokens")
             ),
+        ),
+    )
+
+    def _get_pdata(self, channel):
+        return self.session.http.get(
+            self.URL_CARONTE.format(channel=channel),
+            acceptable_status=(200, 403, 404),
+            schema=self._schema_pdata,
         )
-        if "code" in pdata:
-            log.error("Error getting pdata: {0}".format(pdata['code']))
-            return
 
-        gbx = self.session.http.get(
+    def _get_gbx(self, channel):
+        return self.session.http.get(
             self.URL_GBX,
             params={
                 "oid": "mtmw",
                 "eid": "/api/mtmw/v2/gbx/mtweb/live/mmc/{0}".format(channel),
             },
-            schema=validate.Schema(
-                validate.parse_json(),
-                {"gbx": validate.text},
-                validate.get("gbx"),
-            ),
+            schema=self._schema_gbx,
         )
 
+    def _get_streams(self):
+        channel = self.match.group("channel")
+
+        # the gbx value doesn't depend on the channel's delivery data, so request both at the same time
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            gbx = executor.submit(self._get_gbx, channel)
+            pdata = self._get_pdata(channel)
+            if "code" in pdata:
+                log.error("Error getting pdata: {0}", pdata['code'])
+                return
+            gbx = gbx.result()
+
         tokens = self.session.http.post(
             pdata["cerbero"],
             acceptable_status=(200, 403, 404),
@@ -86,30 +116,25 @@ class Mitele(Plugin):
                 "gbx": gbx,
             },
             headers={"origin": "https://www.mitele.es"},
-            schema=validate.Schema(
-                validate.parse_json(),
-                validate.any(
-                    {"code": int},
-                    validate.all(
-                        {"tokens": {validate.text: {"cdn": validate.text}}},
-                        validate.get("tokens")
-                    ),
-                ),
-            ),
+            schema=self._schema_tokens,
         )
         if "code" in tokens:
             tokenerrors = self.TOKEN_ERRORS.get(tokens["code"], "unknown error")
-            log.error("Could not get stream tokens: {0} ({1})".format(tokens['code'], tokenerrors))
+            log.error("Could not get stream tokens: {0} ({1})", tokens['code'], tokenerrors)
             return
 
-        urls = set()
+        urls = OrderedDict()
+        # streams of the same CDN share their token, so only parse each one once
+        cdn_qsds = {}
         for stream in pdata["dls"]:
             if stream["drm"]:
                 log.warning("Stream may be protected by DRM")
                 continue
             cdn_token = tokens.get(stream["lid"], {}).get("cdn", "")
-            qsd = parse_qsd(cdn_token)
-            urls.add(update_qsd(stream["stream"], qsd, quote_via=lambda string, *_, **__: string))
+            qsd = cdn_qsds.get(cdn_token)
+            if qsd is None:
+                qsd = cdn_qsds[cdn_token] = parse_qsd(cdn_token)
+            urls[update_qsd(stream["stream"], qsd, quote_via=_quote_via)] = None
 
         for url in urls:
             for s in HLSStream.parse_variant_playlist(self.session, url, name_fmt="{pixels}_{bitrate}").items():
@@ -18,16 +18,26 @@ log = logging.getLogger(__name__)
     r"https?://(?:www\.)?pandalive\.co\.kr/"
 ))
 class Pandalive(Plugin):
-    def _get_streams(self):
-        media_code = self.session.http.get(self.url, schema=validate.Schema(
-            re.compile(r"""routePath:\s*(?P<q>["'])(\\u002F|/)live(\\u002F|/)play(\\u002F|/)(?P<id>.+?)(?P=q)"""),
-            validate.any(None, validate.get("id")),
-        ))
+    _re_route_path = re.compile(
+        r"""routePath:\s*(?P<q>["'])(?:\\u002F|/)live(?:\\u002F|/)play(?:\\u002F|/)(?P<id>[^"']+)(?P=q)"""
+    )
+
+    def _get_media_code(self):
+        text = self.session.http.get(self.url).text
+        # only match the pattern where its literal prefix occurs instead of scanning the whole page
+        idx = text.find("routePath:")
+        while idx >= 0:
+            match = self._re_route_path.match(text, idx)
+            if match:
+                return match.group("id")
+            idx = text.find("routePath:", idx + 1)
 
+    def _get_streams(self):
+        media_code = self._get_media_code()
         if not media_code:
             return
 
-        log.debug("Media code: {0}".format(media_code))
+        log.debug("Media code: {0}", media_code)
 
         json = self.session.http.post(
             "https://api.pandalive.co.kr/v1/live/play",
@@ -81,7 +91,7 @@ class Pandalive(Plugin):
             log.error("The broadcast is password protected")
             return
 
-        log.info("Broadcast type: {0}".format(json['media']['liveType']))
+        log.info("Broadcast type: {0}", json['media']['liveType'])
 
         self.author = "{0} ({1})".format(json['media']['userNick'], json['media']['userId'])
         self.title = "{0}".format(json['media']['title'])
@@ -89,9 +99,10 @@ class Pandalive(Plugin):
         playlist = json["PlayList"]
         for key in ("hls", "hls2", "hls3"):
             # use the first available HLS stream
-            if key in playlist and playlist[key]:
+            streams = playlist.get(key)
+            if streams:
                 # all stream qualities share the same URL, so just use the first one
-                return HLSStream.parse_variant_playlist(self.session, playlist[key][0]["url"])
+                return HLSStream.parse_variant_playlist(self.session, streams[0]["url"])
 
 
 __plugin__ = Pandalive
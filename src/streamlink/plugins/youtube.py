@@ -23,6 +23,8 @@ from streamlink.utils.parse import parse_json
 
 log = logging.getLogger(__name__)
 
+_json_decoder = json.JSONDecoder()
+
 
 @pluginmatcher(re.compile(r"""
     https?://(?:\w+\.)?youtube\.com/
@@ -288,12 +290,24 @@ class YouTube(Plugin):
 
     @staticmethod
     def _get_data_from_regex(res, regex, descr):
-        match = re.search(regex, res.text)
+        match = regex.search(res.text)
         if not match:
             log.debug("Missing {}".format(descr))
             return
         return parse_json(match.group(1))
 
+    @classmethod
+    def _get_data_from_var(cls, res, var, regex, descr):
+        # decode the assigned JSON object right where it starts, instead of searching for its end with the regex
+        anchor = "var {0} = {{".format(var)
+        idx = res.text.find(anchor)
+        if idx >= 0:
+            try:
+                return _json_decoder.raw_decode(res.text, idx + len(anchor) - 1)[0]
+            except ValueError:
+                pass
+        return cls._get_data_from_regex(res, regex, descr)
+
     def _get_data_from_api(self, res):
         _i_video_id = self.match.group("video_id")
         if _i_video_id is None:
@@ -358,7 +372,7 @@ class YouTube(Plugin):
         res = self._get_res(self.url)
 
         if self.match.group("channel") and not self.match.group("channel_live"):
-            initial = self._get_data_from_regex(res, self._re_ytInitialData, "initial data")
+            initial = self._get_data_from_var(res, "ytInitialData", self._re_ytInitialData, "initial data")
             video_id = self._data_video_id(initial)
             if video_id is None:
                 log.error("Could not find videoId on channel page")
@@ -366,7 +380,9 @@ class YouTube(Plugin):
             self.url = self._url_canonical.format(video_id=video_id)
             res = self._get_res(self.url)
 
-        data = self._get_data_from_regex(res, self._re_ytInitialPlayerResponse, "initial player response")
+        data = self._get_data_from_var(
+            res, "ytInitialPlayerResponse", self._re_ytInitialPlayerResponse, "initial player response"
+        )
         if not self._data_status(data):
             data = self._get_data_from_api(res)
             if not self._data_status(data, True):
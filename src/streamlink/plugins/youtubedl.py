@@ -10,6 +10,7 @@ from __future__ import unicode_literals
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from platform import node as hostname
 
 from streamlink.plugin import Plugin, PluginArgument, PluginArguments, PluginError, pluginmatcher
@@ -25,6 +26,11 @@ except ImportError:
     youtubedl = False
     log.trace("YoutubeDL is not available")
 
+# the host name of the STB doesn't change while running
+_hostname = hostname()
+# prefix of temporary playlist directories, whose playlists always get overwritten
+_tmp_prefix = "/tmp/." + __name__
+
 
 @pluginmatcher(re.compile(r"""
     youtubedl://(?:https?://)?(?:\w+\.)?youtu(?:\.be|be\.com)
@@ -53,6 +59,8 @@ except ImportError:
     )
 """, re.VERBOSE))
 class YouTubeDL(Plugin):
+    _re_3d = re.compile(r"(\w+)_3d")
+    _re_hfr = re.compile(r"(\d+p)(\d+)")
     _re_ytInitialPlayerResponse = re.compile(r"""var\s+ytInitialPlayerResponse\s*=\s*({.*?});\s*var\s+meta\s*=""", re.DOTALL)
 
     _url_canonical = "https://www.youtube.com/watch?v={video_id}"
@@ -77,6 +85,11 @@ class YouTubeDL(Plugin):
         336: "1440p60hdr",  # vp9 HFR HDR
         337: "2160p60hdr",  # vp9 HFR HDR
     }
+    # the merged video itags of the available codec selections, built only once
+    _adp_video_h264_vp9 = dict(adp_video_h264)
+    _adp_video_h264_vp9.update(adp_video_vp9)
+    _adp_video_h264_vp9_hdr = dict(_adp_video_h264_vp9)
+    _adp_video_h264_vp9_hdr.update(adp_video_vp9_hdr)
     video = {  # h264
         93: "360p",  # HLS
         94: "480p",  # HLS
@@ -143,8 +156,8 @@ class YouTubeDL(Plugin):
 
     @classmethod
     def stream_weight(cls, stream):
-        match_3d = re.match(r"(\w+)_3d", stream)
-        match_hfr = re.match(r"(\d+p)(\d+)", stream)
+        match_3d = cls._re_3d.match(stream)
+        match_hfr = cls._re_hfr.match(stream)
         if match_3d:
             weight, group = Plugin.stream_weight(match_3d.group(1))
             weight -= 1
@@ -165,8 +178,7 @@ class YouTubeDL(Plugin):
 
         adaptive_streams = {}
         best_audio_itag = None
-        adp_video = self.adp_video_h264.copy()
-        vp9 = "vp9" if hostname() in self.stb_vp9_1 or hostname() in self.stb_vp9_2 else ""
+        vp9 = "vp9" if _hostname in self.stb_vp9_1 or _hostname in self.stb_vp9_2 else ""
         if not vp9:
             log.debug("STB w/o vp9 4K support detected")
             if self.get_option("yes-vp9-codecs"):
@@ -174,27 +186,33 @@ class YouTubeDL(Plugin):
         elif self.get_option("no-vp9-codecs"):
             vp9 = ""
             log.info("VP9 Codecs are skipped")
-        if vp9:
-            adp_video.update(self.adp_video_vp9)
-            if self.get_option("yes-vp9-hdr-codecs") or hostname() in self.stb_vp9_2:
-                adp_video.update(self.adp_video_vp9_hdr)
+        if not vp9:
+            adp_video = self.adp_video_h264
+        elif self.get_option("yes-vp9-hdr-codecs") or _hostname in self.stb_vp9_2:
+            adp_video = self._adp_video_h264_vp9_hdr
+        else:
+            adp_video = self._adp_video_h264_vp9
+
+        no_opus = self.get_option("no-opus-codec")
+        log_debug = log.isEnabledFor(logging.DEBUG)
 
         # Extract streams from the DASH format list
         for stream_info in info.get("formats", []):
             itag = int(stream_info["format_id"])
             if itag not in self.adp_audio and itag not in adp_video:
-                log.debug(
-                    "Skipped format:{}, Codec:{}",
-                    stream_info["format"],
-                    stream_info["acodec"] if stream_info["acodec"] != "none" else stream_info["vcodec"],
-                )
+                if log_debug:
+                    log.debug(
+                        "Skipped format:{}, Codec:{}",
+                        stream_info["format"],
+                        stream_info["acodec"] if stream_info["acodec"] != "none" else stream_info["vcodec"],
+                    )
                 continue
 
             # extract any high quality streams only available in adaptive formats and not skipped
             adaptive_streams[itag] = stream_info["url"]
             stream_format = stream_info["ext"]
             if itag in self.adp_audio:
-                if self.get_option("no-opus-codec") and stream_info["acodec"] == "opus":
+                if no_opus and stream_info["acodec"] == "opus":
                     log.debug("Skipped format:{}, Codec:{}", stream_info["format"], stream_info["acodec"])
                     continue
 
@@ -223,8 +241,9 @@ class YouTubeDL(Plugin):
         return streams
 
     def _save2M3U(self, pl_path, info, ua):
-        m3u = "#EXTM3U,$MODE=IPTV\n"
-        if pl_path.startswith("/tmp/." + __name__):
+        m3u = ["#EXTM3U,$MODE=IPTV\n"]
+        is_tmp = pl_path.startswith(_tmp_prefix)
+        if is_tmp:
             pl_title = "Playlist(temp.)"
         else:
             pl_title = info["title"]
@@ -236,12 +255,12 @@ class YouTubeDL(Plugin):
 
             url = "http://127.0.0.1:8088/youtubedl://youtube.com/watch?v={0}".format(url)
             if title not in ["[Deleted video]", "[Private video]"]:
-                m3u += "#EXTINF:0,{0}\n{1}\n".format(title, url)
+                m3u.append("#EXTINF:0,{0}\n{1}\n".format(title, url))
 
         path = os.path.join(pl_path, "YTDL: " + pl_title + ".m3u").encode("utf8")
-        if not os.path.isfile(path) or path.startswith("/tmp/." + __name__):
+        if is_tmp or not os.path.isfile(path):
             with open(path, "w") as f:
-                f.write(m3u)
+                f.write("".join(m3u))
             log.info("M3U Playlist '{0}' written".format(path))
         else:
             log.info("M3U Playlist '{0}' exists, skipped".format(path))
@@ -249,24 +268,38 @@ class YouTubeDL(Plugin):
     def _get_stream_info(self, video_id, pl_id):
         info = None
         log.debug("Starting YoutubeDL process")
+        executor = ThreadPoolExecutor(max_workers=1)
+        pl_info = None
         try:
+            pl_path = self.get_option("playlist-dir")
+            if pl_id and pl_path:
+                # the playlist doesn't depend on the video info, so extract it at the same time,
+                # using a separate YoutubeDL instance, as its instances aren't thread-safe
+                url = "https://www.youtube.com/playlist?list=%s" % pl_id
+                pl_info = executor.submit(
+                    YoutubeDL(self.ytdl_options).extract_info,
+                    url, ie_key="YoutubePlaylist", download=False, process=True,
+                )
+
             ytdl = YoutubeDL(self.ytdl_options)
             url = "https://www.youtube.com/watch?v=%s" % video_id
             info = ytdl.extract_info(url, ie_key="Youtube", download=False, process=True)
             ua = info["formats"][-1]["http_headers"]["User-Agent"]
             self.session.http.headers.update({"User-Agent": ua})
 
-            pl_path = self.get_option("playlist-dir")
-            if pl_id and pl_path:
+            if pl_info is not None:
                 if not os.path.isdir(pl_path):
                     os.makedirs(pl_path)
                     log.debug("Playlist directory '{0}' created".format(pl_path))
 
-                url = "https://www.youtube.com/playlist?list=%s" % pl_id
-                _info = ytdl.extract_info(url, ie_key="YoutubePlaylist", download=False, process=True)
-                self._save2M3U(pl_path, _info, ua)
+                self._save2M3U(pl_path, pl_info.result(), ua)
         except Exception as e:
+            # don't let an unrelated playlist extraction delay the error
+            if pl_info is not None:
+                pl_info.cancel()
             raise PluginError(e)
+        finally:
+            executor.shutdown(wait=False)
 
         return info
 
@@ -291,10 +324,11 @@ class YouTubeDL(Plugin):
             is_live = True
 
         streams = {}
+        log_skipped = is_live and log.isEnabledFor(logging.DEBUG)
         for stream_info in info.get("formats", []):
             itag = int(stream_info["format_id"])
             if itag not in self.video:
-                if is_live:
+                if log_skipped:
                     log.debug(
                         "Skipped format:{}, Codecs: v {} a {}",
                         stream_info["format"],
@@ -6,6 +6,21 @@ from lxml.etree import HTML, XML
 from streamlink.compat import is_py2, is_py3, parse_qsl, str
 from streamlink.plugin import PluginError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _json_loads(data, *args, **kwargs):
+    if orjson is not None and not args and not kwargs:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # let the json module parse or reject what orjson doesn't accept, e.g. NaN values or large integers
+            pass
+    return json.loads(data, *args, **kwargs)
+
 
 def _parse(parser, data, name, exception, schema, *args, **kwargs):
     try:
@@ -33,9 +48,10 @@ def parse_json(
     """Wrapper around json.loads.
 
     Provides these extra features:
+     - Uses orjson for parsing if it's available and no extra json.loads arguments were set
      - Wraps errors in custom exception with a snippet of the data in the message
     """
-    return _parse(json.loads, data, name, exception, schema, *args, **kwargs)
+    return _parse(_json_loads, data, name, exception, schema, *args, **kwargs)
 
 
 def parse_html(
@@ -115,6 +115,10 @@ class TestPluginStream(unittest.TestCase):
 
     def test_parse_params(self):
         self.assertEqual({}, parse_params())
+        self.assertEqual(
+            dict(a="foo", b=1, c=-1.5, d=True, e=None, f="bar", g=[1], h="True_", i="value"),
+            parse_params("""a=foo b=1 c=-1.5 d=True e=None f='bar' g=[1] h=True_ i=value""")
+        )
         self.assertEqual(
             dict(verify=False, params=dict(key="a value")),
             parse_params("""verify=False params={'key': 'a value'}""")
@@ -138,6 +142,12 @@ class TestPluginStream(unittest.TestCase):
         self.assertEqual((780, "pixels"),
                          stream_weight("720p60"))
 
+    def test_stream_weight_cached(self):
+        stream_weight.cache_clear()
+        self.assertEqual(stream_weight("1080p"), stream_weight("1080p"))
+        self.assertEqual(stream_weight.cache_info().hits, 1)
+        self.assertEqual(stream_weight.cache_info().misses, 1)
+
     def test_stream_weight(self):
         self.assertGreater(stream_weight("720p+"),
                            stream_weight("720p"))
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import re
+from collections import OrderedDict
 from textwrap import dedent
 
 import pytest
@@ -9,7 +10,10 @@ from streamlink.compat import Match, is_py2, str as text_type
 from streamlink.exceptions import PluginError
 from streamlink.plugin.api import validate
 # noinspection PyProtectedMember
-from streamlink.plugin.api.validate._exception import ValidationError
+from streamlink.plugin.api.validate._exception import LazyRepr, ValidationError
+# noinspection PyProtectedMember
+from streamlink.plugin.api.validate._validate import _validate, _validate_fast
+from tests.mock import patch
 
 
 def assert_validationerror(exception, expected):
@@ -20,6 +24,11 @@ def test_text_is_str():
     assert validate.text is text_type, "Exports text as str alias for backwards compatiblity"
 
 
+def test_dispatch_table():
+    for cls, func in _validate_fast.items():
+        assert _validate.dispatch(cls) is func, "Fast dispatch table matches singledispatch for {0}".format(cls.__name__)
+
+
 class TestSchema(object):
     @pytest.fixture(scope="class")
     def schema(self):
@@ -69,6 +78,67 @@ class TestSchema(object):
             """)
 
 
+class TestSchemaCompile(object):
+    @pytest.mark.parametrize("schema,value", [
+        ((str, "foo"), "foo"),
+        ((str, "foo"), "bar"),
+        (([int], ), [1, 2, 3]),
+        (([int], ), [1, "2", 3]),
+        (((int, str), ), (1, "2")),
+        (({"foo": int, validate.optional("bar"): str}, ), {"foo": 1}),
+        (({"foo": int, validate.optional("bar"): str}, ), {"foo": 1, "bar": "2"}),
+        (({"foo": int, validate.optional("bar"): str}, ), {"foo": 1, "bar": 2}),
+        (({"foo": int}, ), {"bar": 1}),
+        (({str: int}, ), {"foo": 1, "bar": 2}),
+        (({str: int}, ), {"foo": 1, "bar": "2"}),
+        (({str: int}, ), {1: 1}),
+        ((validate.any(int, str), ), "foo"),
+        ((validate.any(int, str), ), None),
+        ((validate.none_or_all(int, validate.transform(str)), ), None),
+        ((validate.none_or_all(int, validate.transform(str)), ), 1),
+        ((validate.none_or_all(int, validate.transform(str)), ), "1"),
+        ((validate.transform(int), validate.all(int, 123)), "123"),
+        ((validate.transform(int), ), "foo"),
+        ((validate.transform("foo"), ), "foo"),
+        ((validate.Schema(str, "foo"), ), "foo"),
+        ((validate.Schema(str, "foo"), ), "bar"),
+        ((re.compile(r"\d+"), validate.get(0)), "abc 123"),
+        (({"a": [{"b": {"c": int, "d": None, "e": True}}]}, ), {"a": [{"b": {"c": 1, "d": None, "e": True}}]}),
+        (({"a": [{"b": {"c": int, "d": None, "e": True}}]}, ), {"a": [{"b": {"c": "1", "d": None, "e": True}}]}),
+        (({"a": [{"b": {"c": int, "d": None, "e": True}}]}, ), {"a": [{"b": {"c": 1, "d": 0, "e": True}}]}),
+        (({"a": [{"b": {"c": int, "d": None, "e": True}}]}, ), {"a": [{"b": []}]}),
+    ])
+    def test_compiled(self, schema, value):
+        schema = validate.Schema(*schema)
+        compiled = schema.compile()
+        try:
+            expected = validate.validate(schema, value)
+        except Exception as err:
+            with pytest.raises(type(err)) as cm:
+                compiled(value)
+            assert str(cm.value) == str(err)
+        else:
+            assert compiled(value) == expected
+
+    def test_cached(self):
+        def build():
+            return validate.Schema({"foo": [validate.get("bar")], validate.optional("baz"): validate.any(int, "qux")})
+
+        assert build().compile() is build().compile()
+        assert build().compile() is not validate.Schema({"foo": [validate.get("baz")]}).compile()
+
+    def test_cached_unhashable(self):
+        schema = validate.Schema(validate.get("foo", default=[]))
+        assert schema.compile() is not schema.compile()
+        assert schema.validate({}) == []
+
+    def test_compile_error(self):
+        with patch("streamlink.plugin.api.validate._validate._compile", side_effect=ValueError("foo")):
+            with pytest.raises(ValueError) as cm:
+                validate.Schema(validate.get("foo", default=[]))
+        assert str(cm.value) == "foo"
+
+
 class TestEquality(object):
     def test_success(self):
         assert validate.validate("foo", "foo") == "foo"
@@ -142,6 +212,15 @@ class TestSequence(object):
                     4 does not equal 3
             """)
 
+    def test_failure_items_single_schema(self):
+        with pytest.raises(ValidationError) as cm:
+            validate.validate([1], [1, 2])
+        assert_validationerror(cm.value, """
+            ValidationError(AnySchema):
+              ValidationError(equality):
+                2 does not equal 1
+        """)
+
     def test_failure_schema(self):
         with pytest.raises(ValidationError) as cm:
             validate.validate([1, 2, 3], {1, 2, 3})
@@ -406,6 +485,21 @@ class TestAnySchema(object):
                     <lambda>(None) is not true
             """)
 
+    @pytest.mark.parametrize("value", ["foo", 1])
+    def test_literals_success(self, value):
+        assert validate.validate(validate.any("foo", 1), value) is value
+
+    def test_literals_failure(self):
+        with pytest.raises(ValidationError) as cm:
+            validate.validate(validate.any("foo", 1), ["unhashable"])
+        assert_validationerror(cm.value, """
+            ValidationError(AnySchema):
+              ValidationError(equality):
+                ['unhashable'] does not equal 'foo'
+              ValidationError(equality):
+                ['unhashable'] does not equal 1
+        """)
+
 
 class TestNoneOrAllSchema(object):
     @pytest.mark.parametrize("data,expected", [("foo", "FOO"), ("bar", None)])
@@ -914,10 +1008,10 @@ class TestStartsWithValidator(object):
     def test_failure_schema(self):
         with pytest.raises(ValidationError) as cm:
             validate.validate(validate.startswith("invalid"), 1)
-            assert_validationerror(cm.value, """
-                ValidationError(type):
-                Type of 1 should be str, but is int
-            """)
+        assert_validationerror(cm.value, """
+            ValidationError(type):
+              Type of 1 should be str, but is int
+        """)
 
 
 class TestEndsWithValidator(object):
@@ -935,10 +1029,10 @@ class TestEndsWithValidator(object):
     def test_failure_schema(self):
         with pytest.raises(ValidationError) as cm:
             validate.validate(validate.endswith("invalid"), 1)
-            assert_validationerror(cm.value, """
-                ValidationError(type):
-                Type of 1 should be str, but is int
-            """)
+        assert_validationerror(cm.value, """
+            ValidationError(type):
+              Type of 1 should be str, but is int
+        """)
 
 
 class TestContainsValidator(object):
@@ -956,10 +1050,10 @@ class TestContainsValidator(object):
     def test_failure_schema(self):
         with pytest.raises(ValidationError) as cm:
             validate.validate(validate.contains("invalid"), 1)
-            assert_validationerror(cm.value, """
-                ValidationError(type):
-                Type of 1 should be str, but is int
-            """)
+        assert_validationerror(cm.value, """
+            ValidationError(type):
+              Type of 1 should be str, but is int
+        """)
 
 
 class TestUrlValidator(object):
@@ -999,6 +1093,14 @@ class TestUrlValidator(object):
                 Invalid URL attribute 'invalid'
             """)
 
+    def test_failure_url_attribute_on_creation(self):
+        with pytest.raises(ValidationError) as cm:
+            validate.url(invalid=str)
+        assert_validationerror(cm.value, """
+            ValidationError(url):
+              Invalid URL attribute 'invalid'
+        """)
+
     def test_failure_subschema(self):
         with pytest.raises(ValidationError) as cm:
             validate.validate(validate.url(hostname="invalid"), self.url)
@@ -1067,6 +1169,26 @@ class TestFilterValidator(object):
         value = (0, 1, 2, 3)
         assert validate.validate(schema, value) == (0, 1)
 
+    def test_list(self):
+        schema = validate.filter(lambda k: k < 2)
+        assert validate.validate(schema, [0, 1, 2, 3]) == [0, 1]
+
+    @pytest.mark.parametrize("func", [None, bool])
+    def test_falsy(self, func):
+        schema = validate.filter(func)
+        assert validate.validate(schema, {"a": 0, "b": 1, "c": "", "d": "foo"}) == {"b": 1, "d": "foo"}
+        assert validate.validate(schema, [0, 1, "", "foo", None]) == [1, "foo"]
+        assert validate.validate(schema, (0, 1, "", "foo", None)) == (1, "foo")
+        result = validate.validate(schema, OrderedDict([("b", 1), ("a", 0), ("c", 1)]))
+        assert type(result) is OrderedDict
+        assert list(result.items()) == [("b", 1), ("c", 1)]
+
+    def test_dict_subclass(self):
+        schema = validate.filter(lambda k, v: v > 0)
+        result = validate.validate(schema, OrderedDict([("b", 1), ("a", 0), ("c", 1)]))
+        assert type(result) is OrderedDict
+        assert list(result.items()) == [("b", 1), ("c", 1)]
+
 
 class TestMapValidator(object):
     def test_dict(self):
@@ -1079,6 +1201,10 @@ class TestMapValidator(object):
         value = (0, 1, 2, 3)
         assert validate.validate(schema, value) == (1, 2, 3, 4)
 
+    def test_list(self):
+        schema = validate.map(lambda k: k + 1)
+        assert validate.validate(schema, [0, 1, 2, 3]) == [1, 2, 3, 4]
+
 
 class TestXmlFindValidator(object):
     def test_success(self):
@@ -1091,6 +1217,12 @@ class TestXmlFindValidator(object):
         root.append(child)
         assert validate.validate(validate.xml_find("./a:foo", namespaces={"a": "http://a"}), root) is child
 
+    def test_shared_instance(self):
+        assert validate.xml_find("./a:foo", namespaces={"a": "http://a"}) \
+            is validate.xml_find("./a:foo", namespaces={"a": "http://a"})
+        assert validate.xml_find("./a:foo", namespaces={"a": "http://a"}) \
+            is not validate.xml_find("./a:foo", namespaces={"a": "http://b"})
+
     def test_failure_no_element(self):
         with pytest.raises(ValidationError) as cm:
             validate.validate(validate.xml_find("*"), Element("foo"))
@@ -1125,6 +1257,16 @@ class TestXmlFindValidator(object):
                 invalid path
         """)
 
+    def test_failure_syntax_on_creation(self):
+        with pytest.raises(ValidationError) as cm:
+            validate.xml_find("[")
+        assert_validationerror(cm.value, """
+            ValidationError(xml_find):
+              ElementPath syntax error: '['
+              Context:
+                invalid path
+        """)
+
 
 class TestXmlFindallValidator(object):
     @pytest.fixture(scope="class")
@@ -1141,6 +1283,10 @@ class TestXmlFindallValidator(object):
     def test_empty(self, element):
         assert validate.validate(validate.xml_findall("missing"), element) == []
 
+    def test_shared_instance(self):
+        assert validate.xml_findall("*") is validate.xml_findall("*")
+        assert validate.xml_findall("*") is not validate.xml_find("*")
+
     def test_namespaces(self):
         root = Element("root")
         for child in Element("{http://a}foo"), Element("{http://unknown}bar"), Element("{http://a}baz"):
@@ -1155,6 +1301,16 @@ class TestXmlFindallValidator(object):
                 iselement('not-an-element') is not true
             """)
 
+    def test_failure_syntax(self):
+        with pytest.raises(ValidationError) as cm:
+            validate.xml_findall("[")
+        assert_validationerror(cm.value, """
+            ValidationError(xml_findall):
+              ElementPath syntax error: '['
+              Context:
+                invalid path
+        """)
+
 
 class TestXmlFindtextValidator(object):
     def test_simple(self):
@@ -1241,6 +1397,27 @@ class TestXmlXpathValidator(object):
                 Invalid expression
         """)
 
+    def test_failure_evaluation_on_creation(self):
+        with pytest.raises(ValidationError) as cm:
+            validate.xml_xpath("?")
+        assert_validationerror(cm.value, """
+            ValidationError(xml_xpath):
+              XPath evaluation error: '?'
+              Context:
+                Invalid expression
+        """)
+
+    def test_failure_evaluation_variables(self):
+        schema = validate.xml_xpath("$missing")
+        with pytest.raises(ValidationError) as cm:
+            validate.validate(schema, Element("root"))
+        assert_validationerror(cm.value, """
+            ValidationError(xml_xpath):
+              XPath evaluation error: '$missing'
+              Context:
+                Undefined variable
+        """)
+
 
 class TestXmlXpathStringValidator(object):
     @pytest.fixture(scope="class")
@@ -1271,6 +1448,10 @@ class TestXmlXpathStringValidator(object):
 
 
 class TestParseJsonValidator(object):
+    def test_shared_instance(self):
+        assert validate.parse_json() is validate.parse_json()
+        assert validate.parse_json(name="foo") is not validate.parse_json()
+
     def test_success(self):
         assert validate.validate(
             validate.parse_json(),
@@ -1473,3 +1654,21 @@ class TestValidationError(object):
             ValidationError:
               foo <Some really long error message that exceeds the maximum...> bar <'Some really long error message that exceeds the maximu...> baz
         """)  # noqa: 501
+
+    def test_lazy_format(self):
+        class Value(object):
+            calls = 0
+
+            def __repr__(self):
+                self.calls += 1
+                return "<value>"
+
+        value = Value()
+        err = ValidationError("foo {value} bar", value=LazyRepr(value))
+        assert value.calls == 0
+        assert_validationerror(err, """
+            ValidationError:
+              foo <value> bar
+        """)
+        assert str(err) == "ValidationError:\n  foo <value> bar"
+        assert value.calls == 1
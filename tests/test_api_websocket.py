@@ -6,8 +6,9 @@ from threading import Event
 import pytest
 from websocket import ABNF, STATUS_NORMAL  # type: ignore[import]
 
+from streamlink.compat import urlparse
 from streamlink.logger import DEBUG, TRACE
-from streamlink.plugin.api.websocket import WebsocketClient
+from streamlink.plugin.api.websocket import WebsocketClient, _proxy_options
 from streamlink.session import Streamlink
 from tests.mock import Mock, call, patch
 
@@ -42,6 +43,13 @@ class TestWebsocketClient(unittest.TestCase):
             WebsocketClient(self.session, "wss://localhost:0")
         self.assertTrue(mock_enable_trace.called)
 
+    def test_thread_name(self):
+        client1 = WebsocketClient(self.session, "wss://localhost:0")
+        client2 = WebsocketClient(self.session, "wss://localhost:0")
+        id1 = int(client1.name[len("Thread-WebsocketClient-"):])
+        id2 = int(client2.name[len("Thread-WebsocketClient-"):])
+        self.assertEqual(id2, id1 + 1)
+
     def test_user_agent(self):
         client = WebsocketClient(self.session, "wss://localhost:0")
         self.assertEqual(client.ws.header, [
@@ -91,6 +99,18 @@ class TestWebsocketClient(unittest.TestCase):
             )
         ])
 
+    def test_proxy_cached(self):
+        self.session.set_option("http-proxy", "http://hostname:5678")
+        _proxy_options.cache_clear()
+        with patch("streamlink.plugin.api.websocket.urlparse", side_effect=urlparse) as mock_urlparse:
+            client1 = WebsocketClient(self.session, "wss://localhost:0")
+            client2 = WebsocketClient(self.session, "wss://localhost:1")
+        self.assertEqual(mock_urlparse.call_count, 1)
+        self.assertEqual(client1._ws_rundata["proxy_type"], "http")
+        self.assertEqual(client1._ws_rundata["http_proxy_host"], "hostname")
+        self.assertEqual(client1._ws_rundata["http_proxy_port"], 5678)
+        self.assertEqual(client1._ws_rundata, client2._ws_rundata)
+
     def test_handlers(self):
         client = WebsocketClient(self.session, "wss://localhost:0")
         self.assertEqual(client.ws.on_open, client.on_open)
@@ -114,6 +134,16 @@ class TestWebsocketClient(unittest.TestCase):
             call("{\"foo\":\"bar\",\"baz\":\"qux\"}", ABNF.OPCODE_TEXT),
         ])
 
+    def test_send_json_non_str_keys(self):
+        client = WebsocketClient(self.session, "wss://localhost:0")
+        with patch.object(client, "ws") as mock_ws:
+            client.send_json({1: "foo"})
+            client.send_json({"foo": u"b\xe4r"})
+        self.assertEqual(mock_ws.send.call_args_list, [
+            call("{\"1\":\"foo\"}", ABNF.OPCODE_TEXT),
+            call("{\"foo\":\"b\\u00e4r\"}", ABNF.OPCODE_TEXT),
+        ])
+
     def test_close(self):
         class WebsocketClientSubclass(WebsocketClient):
             running = Event()
@@ -1,8 +1,11 @@
 import datetime
+import gc
+import json
 import os.path
 import sys
 import tempfile
 import unittest
+import weakref
 from shutil import rmtree
 
 import streamlink.cache
@@ -19,6 +22,7 @@ class TestCache(unittest.TestCase):
         self.cache = streamlink.cache.Cache("cache.json")
 
     def tearDown(self):
+        streamlink.cache._dirty_caches.clear()
         rmtree(self.tmp_dir)
 
     def test_get_no_file(self):
@@ -49,6 +53,121 @@ class TestCache(unittest.TestCase):
         self.cache._load()
         self.assertEqual({}, self.cache._cache)
 
+    def test_load_unchanged_file(self):
+        self.cache.set("value", 1)
+        self.cache.flush()
+        with patch("streamlink.cache._loads") as mock_load:
+            self.assertEqual(self.cache.get("value"), 1)
+            self.assertEqual(self.cache.get("value"), 1)
+        self.assertEqual(mock_load.call_count, 0)
+
+    def test_load_unsaved_changes(self):
+        self.cache.set("value", 1)
+        with patch("streamlink.cache.Cache._get_stat") as mock_get_stat:
+            self.assertEqual(self.cache.get("value"), 1)
+            self.assertEqual(self.cache.get_all(), {"value": 1})
+        self.assertEqual(mock_get_stat.call_count, 0)
+
+    def test_load_changed_file(self):
+        expires_at = datetime.datetime.now() + datetime.timedelta(days=1)
+        self.cache.set("value", 1, expires_at=expires_at)
+        self.cache.flush()
+        stat = os.stat(self.cache.filename)
+        other = streamlink.cache.Cache("cache.json")
+        other.set("value", 2, expires_at=expires_at)
+        other.flush()
+        # same size and mtime as before, which only the inode number can tell apart
+        os.utime(self.cache.filename, (stat.st_atime, stat.st_mtime))
+        self.assertEqual(os.stat(self.cache.filename).st_size, stat.st_size)
+        self.assertEqual(self.cache.get("value"), 2)
+
+    def test_load_changed_file_mtime(self):
+        self.cache.set("value", 1)
+        self.cache.flush()
+        stat = os.stat(self.cache.filename)
+        with open(self.cache.filename, "rb") as fd:
+            data = fd.read()
+        # rewrite the file in place with the same size and a different mtime
+        with open(self.cache.filename, "r+b") as fd:
+            fd.write(data.replace(b"\"value\":1,", b"\"value\":2,"))
+        os.utime(self.cache.filename, (stat.st_atime, stat.st_mtime + 10))
+        self.assertEqual(self.cache.get("value"), 2)
+
+    def test_flush(self):
+        self.cache.set("value", 1)
+        self.assertFalse(os.path.exists(self.cache.filename))
+        self.cache.flush()
+        self.assertTrue(os.path.exists(self.cache.filename))
+        self.assertEqual(streamlink.cache.Cache("cache.json").get("value"), 1)
+
+    def test_flush_fail(self):
+        self.cache.set("value", 1)
+        with patch("streamlink.cache.os_replace", side_effect=OSError):
+            self.cache.flush()
+        self.assertFalse(os.path.exists(self.cache.filename))
+        self.assertTrue(self.cache._dirty)
+
+        self.cache.flush()
+        self.assertEqual(streamlink.cache.Cache("cache.json").get("value"), 1)
+
+    def test_flush_all(self):
+        self.cache.set("value", 1)
+        other = streamlink.cache.Cache("cache.json", key_prefix="other")
+        other.set("value", 2)
+        streamlink.cache._flush_all()
+        self.assertEqual(streamlink.cache.Cache("cache.json").get("value"), 1)
+        self.assertEqual(streamlink.cache.Cache("cache.json", key_prefix="other").get("value"), 2)
+
+    def test_flush_all_error(self):
+        other = streamlink.cache.Cache("other.json")
+        self.cache.set("value", 1)
+        other.set("value", 2)
+        with patch.object(self.cache, "flush", side_effect=ValueError):
+            streamlink.cache._flush_all()
+        self.assertEqual(streamlink.cache.Cache("other.json").get("value"), 2)
+
+    def test_flush_big_int(self):
+        self.cache.set("value", 2 ** 70)
+        self.cache.flush()
+        self.assertEqual(os.listdir(self.tmp_dir), ["cache.json"])
+        self.assertEqual(streamlink.cache.Cache("cache.json").get("value"), 2 ** 70)
+
+    def test_flush_unserializable(self):
+        self.cache.set("value", object())
+        self.cache.flush()
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+        self.assertTrue(self.cache._dirty)
+
+    def test_flush_all_unreferenced(self):
+        cache = streamlink.cache.Cache("other.json")
+        cache.set("value", 1)
+        ref = weakref.ref(cache)
+        del cache
+        gc.collect()
+        self.assertIsNotNone(ref())
+
+        streamlink.cache._flush_all()
+        self.assertEqual(streamlink.cache.Cache("other.json").get("value"), 1)
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_flush_merge(self):
+        other = streamlink.cache.Cache("cache.json", key_prefix="other")
+        self.cache.set("value", 1)
+        other.set("value", 2)
+        self.cache.flush()
+        other.flush()
+
+        self.assertEqual(streamlink.cache.Cache("cache.json").get("value"), 1)
+        self.assertEqual(streamlink.cache.Cache("cache.json", key_prefix="other").get("value"), 2)
+
+    def test_json(self):
+        self.cache.set("value", {1: "foo"})
+        self.cache.flush()
+        with open(self.cache.filename, "rb") as fd:
+            self.assertEqual(json.loads(fd.read().decode("utf-8"))["value"]["value"], {"1": "foo"})
+        self.assertEqual(streamlink.cache.Cache("cache.json").get("value"), {"1": "foo"})
+
     def test_expired(self):
         self.cache.set("value", 10, expires=-20)
         self.assertEqual(None, self.cache.get("value"))
@@ -74,8 +193,10 @@ class TestCache(unittest.TestCase):
         try:
             streamlink.cache.cache_dir = os.path.join(tempfile.gettempdir(), "streamlink-test")
             cache = streamlink.cache.Cache("cache.json")
+            self.assertTrue(os.path.isdir(streamlink.cache.cache_dir))
             self.assertFalse(os.path.exists(cache.filename))
             cache.set("value", 10)
+            cache.flush()
             self.assertTrue(os.path.exists(cache.filename))
         finally:
             rmtree(streamlink.cache.cache_dir, ignore_errors=True)
@@ -87,6 +208,7 @@ class TestCache(unittest.TestCase):
             cache = streamlink.cache.Cache("cache.json")
             self.assertFalse(os.path.exists(cache.filename))
             cache.set("value", 10)
+            cache.flush()
             self.assertFalse(os.path.exists(cache.filename))
         finally:
             rmtree(streamlink.cache.cache_dir, ignore_errors=True)
@@ -110,6 +232,26 @@ class TestCache(unittest.TestCase):
             {"test3": 3, "test4": 4},
             self.cache.get_all())
 
+    def test_get_all_no_prefix(self):
+        self.cache.set("test1", 1)
+        self.cache.key_prefix = "test"
+        self.cache.set("test2", 2)
+        self.cache.key_prefix = "test:sub"
+        self.cache.set("test3", 3)
+        self.cache.key_prefix = ""
+
+        self.assertDictEqual(
+            {"test1": 1, "test:test2": 2, "test:sub:test3": 3},
+            self.cache.get_all())
+        self.assertEqual(self.cache.get("test:test2"), 2)
+
+    def test_get_key_prefix_flat(self):
+        self.cache.set("test:value", 1)
+        self.cache.flush()
+        cache = streamlink.cache.Cache("cache.json", key_prefix="test")
+        self.assertEqual(cache.get("value"), 1)
+        self.assertEqual(cache.get_all(), {"value": 1})
+
     def test_get_all_prune(self):
         self.cache.set("test1", 1)
         self.cache.set("test2", 2, -1)
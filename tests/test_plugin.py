@@ -1,6 +1,7 @@
 import re
 import time
 import unittest
+from collections import OrderedDict
 
 import freezegun
 import pytest
@@ -13,12 +14,14 @@ from streamlink.plugin import (
     Plugin,
     PluginArgument,
     PluginArguments,
+    PluginOptions,
     pluginargument,
     pluginmatcher,
 )
 # noinspection PyProtectedMember
 from streamlink.plugin.plugin import Matcher, _COOKIE_KEYS
 from streamlink.session import Streamlink
+from streamlink.stream import HLSStream, HTTPStream
 from tests.mock import Mock, call, patch
 
 
@@ -85,6 +88,71 @@ class TestPluginMatcher(unittest.TestCase):
         self.assertEqual(plugin.match, None)
 
 
+class TestPluginOptions:
+    def test_separate_options(self):
+        class PluginA(FakePlugin):
+            pass
+
+        class PluginB(FakePlugin):
+            pass
+
+        PluginA.set_option("foo", "bar")
+        assert PluginA.get_option("foo") == "bar"
+        assert PluginB.get_option("foo") is None
+        assert Plugin.get_option("foo") is None
+
+        class PluginC(FakePlugin):
+            options = PluginOptions({"foo": "bar", "baz": "qux"})
+
+        class PluginD(PluginC):
+            pass
+
+        PluginC.set_option("baz", "quux")
+        PluginD.set_option("foo", "qux")
+        assert PluginD.get_option("foo") == "qux"
+        assert PluginD.get_option("baz") == "quux"
+        assert PluginD.options.defaults == {"foo": "bar", "baz": "qux"}
+        assert PluginC.get_option("foo") == "bar"
+
+
+class TestPluginStreams:
+    def test_alt_names(self):
+        session = Streamlink()
+
+        class AltStreamsPlugin(Plugin):
+            def _get_streams(self):
+                return [("vod", HTTPStream(session, "http://test.se/{0}".format(i))) for i in range(4)] + [
+                    ("vod", HLSStream(session, "http://test.se/hls")),
+                ]
+
+        streams = AltStreamsPlugin("http://test.se").streams(stream_types=["http", "hls"])
+        assert isinstance(streams, OrderedDict)
+        assert sorted(streams) == ["vod", "vod_alt", "vod_alt2", "vod_hls"]
+        assert streams["vod"].url == "http://test.se/0"
+        assert streams["vod_alt"].url == "http://test.se/1"
+        assert streams["vod_alt2"].url == "http://test.se/2"
+
+    def test_names(self):
+        session = Streamlink()
+
+        class NamedStreamsPlugin(Plugin):
+            def _get_streams(self):
+                return [
+                    ("720p+", HTTPStream(session, "http://test.se/1")),
+                    ("Audio_Only", HTTPStream(session, "http://test.se/2")),
+                    ("480p-foo", HTTPStream(session, "http://test.se/3")),
+                    ("360p^bar", HTTPStream(session, "http://test.se/4")),
+                    ("-invalid", HTTPStream(session, "http://test.se/5")),
+                ]
+
+        NamedStreamsPlugin.logger = Mock()
+        streams = NamedStreamsPlugin("http://test.se").streams()
+        assert sorted(streams) == ["360p^bar", "480p", "720p+", "audio_only", "best", "worst"]
+        assert NamedStreamsPlugin.logger.debug.call_args_list == [
+            call("The stream '{0}' has been ignored since it is badly named.", "-invalid"),
+        ]
+
+
 class TestPluginArguments:
     @pluginargument("foo", dest="_foo", help="FOO")
     @pluginargument("bar", dest="_bar", help="BAR")
@@ -242,6 +310,20 @@ class TestCookies:
         )]
         assert logger.debug.call_args_list == [call("Saved cookies: test-name1")]
 
+    @pytest.mark.parametrize("plugincache", [{}], indirect=True)
+    def test_save_missing_attributes(self, session, plugin, plugincache):
+        # type: (Streamlink, Plugin, Mock)
+        cookie = requests.cookies.create_cookie("test-name", "test-value", domain="test.se")
+        del cookie.comment_url
+        session.http.cookies.set_cookie(cookie)
+
+        plugin.save_cookies(default_expires=3600)
+        assert plugincache.set.call_args_list == [call(
+            "__cookie:test-name:test.se:80:/",
+            _create_cookie_dict("test-name", "test-value", None),
+            3600,
+        )]
+
     @freezegun.freeze_time("1970-01-01T00:00:00Z")
     @pytest.mark.parametrize("plugincache", [{}], indirect=True)
     def test_save_expires(self, session, plugin, plugincache):
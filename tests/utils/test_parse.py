@@ -10,6 +10,7 @@ from streamlink.exceptions import PluginError
 from streamlink.plugin.api import validate
 from streamlink.plugin.api.validate import xml_element
 from streamlink.utils.parse import parse_html, parse_json, parse_qsd, parse_xml
+from tests.mock import Mock, call, patch
 
 
 class TestUtilsParse(unittest.TestCase):
@@ -21,6 +22,20 @@ class TestUtilsParse(unittest.TestCase):
         self.assertRaises(IOError, parse_json, """{"test: 1}""", exception=IOError)
         self.assertRaises(PluginError, parse_json, """{"test: 1}""" * 10)
 
+    def test_parse_json_orjson(self):
+        mock_orjson = Mock(loads=Mock(return_value={"test": 1}))
+        with patch("streamlink.utils.parse.orjson", mock_orjson):
+            self.assertEqual({"test": 1}, parse_json("""{"test": 1}"""))
+            self.assertEqual(mock_orjson.loads.call_args_list, [call("""{"test": 1}""")])
+
+            mock_orjson.loads.reset_mock()
+            self.assertEqual({"test": 1}, parse_json("""{"test": 1}""", object_pairs_hook=dict))
+            self.assertEqual(mock_orjson.loads.call_args_list, [])
+
+            mock_orjson.loads.side_effect = ValueError
+            self.assertEqual({"test": float("inf")}, parse_json("""{"test": Infinity}"""))
+            self.assertRaises(PluginError, parse_json, """{"test: 1}""")
+
     def test_parse_xml(self):
         expected = Element("test", {"foo": "bar"})
         actual = parse_xml("""<test foo="bar"/>""", ignore_ns=True)